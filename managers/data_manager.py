@@ -8,6 +8,7 @@ from typing import Optional, Callable, Dict, Any, List
 from datetime import datetime
 
 from ..api.client import APIClient
+from ..api.exceptions import APIException
 from .project_manager import ProjectManager
 from .sync_manager import SyncManager
 from ..utils.config import Config
@@ -44,6 +45,15 @@ class DataManager:
     instead of generic /api-data/ endpoint.
     """
 
+    # Fields the API rejects as NULL, with the value sent in their place
+    REQUIRED_FIELD_DEFAULTS = {
+        'LandHolding': {'dropped': False},
+        'DrillPad': {'status': 'planned'},
+    }
+
+    # Point models whose geometry is pushed as latitude/longitude/elevation/epsg
+    COORDINATE_MODELS = ('PointSample', 'DrillCollar')
+
     def __init__(
         self,
         config: Config,
@@ -356,7 +366,7 @@ class DataManager:
                 progress_callback(10, f"Detecting changes for {model_name}...")
 
             # Get changed features from layer (only features that differ from server snapshot)
-            features, total_checked, skipped = self.sync_manager.get_changed_features(
+            features, server_records, total_checked, skipped = self.sync_manager.get_changed_features(
                 model_name=model_name,
                 progress_callback=lambda p: progress_callback(10 + int(p * 0.2), "Checking for changes...") if progress_callback else None,
                 project_name=project.name if project else None
@@ -374,6 +384,7 @@ class DataManager:
             # Push each feature using upsert (server handles create vs update)
             created = 0
             updated = 0
+            not_writable = 0
             errors = []
 
             # Get schema for filtering push data (including custom fields if available)
@@ -388,56 +399,97 @@ class DataManager:
 
             for i, feature in enumerate(features):
                 try:
-                    # Filter feature data to only include fields accepted by API
-                    push_data = feature
-                    if schema:
-                        push_data = schema.filter_for_push(feature)
-
-                    # Ensure project natural key is set
-                    # The server uses this to look up the record for upsert
-                    project_value = push_data.get('project')
-                    needs_project = (
-                        not project_value or
-                        project_value is None or
-                        project_value == '' or
-                        project_value == 'NULL'
-                    )
+                    # Existing record with a known server version: PATCH only the
+                    # fields that changed instead of re-sending the whole feature
+                    server_record = server_records[i]
+                    needs_upsert = True
+                    if server_record and server_record.get('id'):
+                        needs_upsert = False
+                        delta = self.sync_manager.compute_feature_delta(feature, server_record)
+                        push_data = self._prepare_patch_payload(
+                            model_name, schema.filter_for_push(delta) if schema else delta
+                        )
 
-                    if needs_project:
-                        if layer_metadata and layer_metadata.get('project_natural_key'):
-                            # Use metadata stored in layer (most reliable)
-                            push_data['project'] = layer_metadata['project_natural_key']
-                        elif project:
-                            # Fallback to active project
-                            push_data['project'] = {
-                                'name': project.name,
-                                'company': project.company_name
-                            }
-
-                    # Ensure coordinate_system_metadata is set
-                    if not push_data.get('coordinate_system_metadata'):
-                        if layer_metadata and layer_metadata.get('crs_metadata'):
-                            push_data['coordinate_system_metadata'] = layer_metadata['crs_metadata']
+                        if push_data:
+                            try:
+                                self.api_client.update_record(
+                                    model_name=model_name,
+                                    record_id=server_record['id'],
+                                    data=push_data
+                                )
+                                updated += 1
+                                self.logger.info(
+                                    f"Updated {model_name}: {feature.get('name')} "
+                                    f"({', '.join(sorted(push_data))})"
+                                )
+                            except APIException as e:
+                                if e.status_code != 404:
+                                    raise
+                                # Deleted on the server since the last pull:
+                                # send the full feature so the upsert recreates it
+                                self.logger.warning(
+                                    f"{model_name} '{feature.get('name')}' no longer exists "
+                                    f"on the server (id {server_record['id']}), re-creating"
+                                )
+                                needs_upsert = True
                         else:
-                            push_data['coordinate_system_metadata'] = self._get_coordinate_system_metadata()
+                            # Changed locally, but only in fields the API does not accept
+                            not_writable += 1
+                            self.logger.info(
+                                f"No writable changes for {model_name}: {feature.get('name')}"
+                            )
 
-                    # Handle model-specific required fields
-                    self._populate_required_fields(model_name, push_data, is_new_feature=True)
+                    if needs_upsert:
+                        # Filter feature data to only include fields accepted by API
+                        push_data = feature
+                        if schema:
+                            push_data = schema.filter_for_push(feature)
+
+                        # Ensure project natural key is set
+                        # The server uses this to look up the record for upsert
+                        project_value = push_data.get('project')
+                        needs_project = (
+                            not project_value or
+                            project_value is None or
+                            project_value == '' or
+                            project_value == 'NULL'
+                        )
 
-                    # Use upsert - server determines create vs update by natural key
-                    result = self.api_client.upsert_record(
-                        model_name=model_name,
-                        data=push_data
-                    )
+                        if needs_project:
+                            if layer_metadata and layer_metadata.get('project_natural_key'):
+                                # Use metadata stored in layer (most reliable)
+                                push_data['project'] = layer_metadata['project_natural_key']
+                            elif project:
+                                # Fallback to active project
+                                push_data['project'] = {
+                                    'name': project.name,
+                                    'company': project.company_name
+                                }
+
+                        # Ensure coordinate_system_metadata is set
+                        if not push_data.get('coordinate_system_metadata'):
+                            if layer_metadata and layer_metadata.get('crs_metadata'):
+                                push_data['coordinate_system_metadata'] = layer_metadata['crs_metadata']
+                            else:
+                                push_data['coordinate_system_metadata'] = self._get_coordinate_system_metadata()
+
+                        # Handle model-specific required fields
+                        self._populate_required_fields(model_name, push_data, is_new_feature=True)
+
+                        # Use upsert - server determines create vs update by natural key
+                        result = self.api_client.upsert_record(
+                            model_name=model_name,
+                            data=push_data
+                        )
 
-                    # Track create vs update based on server response
-                    if result.get('_status') == 'created':
-                        created += 1
-                        self.logger.info(f"Created {model_name}: {feature.get('name')}")
-                    else:
-                        # Default to updated if status not specified
-                        updated += 1
-                        self.logger.info(f"Updated {model_name}: {feature.get('name')}")
+                        # Track create vs update based on server response
+                        if result.get('_status') == 'created':
+                            created += 1
+                            self.logger.info(f"Created {model_name}: {feature.get('name')}")
+                        else:
+                            # Default to updated if status not specified
+                            updated += 1
+                            self.logger.info(f"Updated {model_name}: {feature.get('name')}")
 
                 except Exception as e:
                     errors.append({'feature': feature.get('name', 'unknown'), 'error': str(e)})
@@ -465,6 +517,7 @@ class DataManager:
                 'updated': updated,
                 'errors': len(errors),
                 'skipped': skipped,
+                'not_writable': not_writable,
                 'error_details': errors if errors else None
             }
 
@@ -1232,19 +1285,10 @@ class DataManager:
             push_data: Data dictionary to be modified in-place
             is_new_feature: True if creating a new record, False if updating
         """
-        def is_null_or_empty(value):
-            """Check if a value is effectively NULL/empty."""
-            return value is None or value == '' or str(value) == 'NULL'
-
-        # LandHolding: 'dropped' field cannot be NULL
-        if model_name == 'LandHolding':
-            if is_null_or_empty(push_data.get('dropped')):
-                push_data['dropped'] = False
-
-        # DrillPad: 'status' defaults to 'planned' if not set
-        elif model_name == 'DrillPad':
-            if is_null_or_empty(push_data.get('status')):
-                push_data['status'] = 'planned'
+        # LandHolding 'dropped' cannot be NULL; DrillPad 'status' defaults to 'planned'
+        for key, default in self.REQUIRED_FIELD_DEFAULTS.get(model_name, {}).items():
+            if self._is_null_or_empty(push_data.get(key)):
+                push_data[key] = default
 
         # For NEW features only: Remove NULL values for optional fields
         # This keeps the payload clean and avoids some validation edge cases
@@ -1262,7 +1306,7 @@ class DataManager:
                 if key == 'geometry':
                     continue
                 # Remove NULL optional fields to keep payload clean
-                if is_null_or_empty(value):
+                if self._is_null_or_empty(value):
                     keys_to_remove.append(key)
 
             for key in keys_to_remove:
@@ -1270,9 +1314,39 @@ class DataManager:
 
         # For Point-based models (PointSample, DrillCollar), extract lat/lon from geometry
         # The API expects latitude, longitude, elevation, epsg - not geometry field
-        if model_name in ('PointSample', 'DrillCollar'):
+        if model_name in self.COORDINATE_MODELS:
             self._extract_coordinates_from_geometry(push_data)
 
+    def _prepare_patch_payload(self, model_name: str, delta: dict) -> dict:
+        """
+        Finalize a changed-fields delta for a PATCH request.
+
+        Unlike _populate_required_fields, keys missing from the delta are left
+        out (the server keeps its value); only a required field that was
+        cleared locally is replaced with its default, since the API rejects
+        NULL for it. Point models get their geometry converted to coordinates.
+
+        Args:
+            model_name: Name of the model being pushed
+            delta: Changed fields, already filtered for push (modified in-place)
+
+        Returns:
+            The delta, ready to send with update_record
+        """
+        for key, default in self.REQUIRED_FIELD_DEFAULTS.get(model_name, {}).items():
+            if key in delta and self._is_null_or_empty(delta[key]):
+                delta[key] = default
+
+        if model_name in self.COORDINATE_MODELS:
+            self._extract_coordinates_from_geometry(delta)
+
+        return delta
+
+    @staticmethod
+    def _is_null_or_empty(value: Any) -> bool:
+        """Check if a value is effectively NULL/empty."""
+        return value is None or value == '' or str(value) == 'NULL'
+
     def _extract_coordinates_from_geometry(self, push_data: dict) -> None:
         """
         Extract latitude, longitude, elevation, and EPSG from EWKT geometry.
@@ -4,8 +4,8 @@ Project and company management for GeodbIO plugin.
 
 Uses user context from /api/v1/me/ for company/project data and permissions.
 """
-from typing import List, Optional, Dict
-from qgis.core import QgsProject
+from typing import List, Optional, Dict, Tuple
+from qgis.core import QgsProject, QgsProjectDirtyBlocker
 
 from ..api.client import APIClient
 from ..models.project import Company, Project, Permission
@@ -13,6 +13,21 @@ from ..models.auth import UserContext
 from ..utils.config import Config
 from ..utils.logger import PluginLogger
 
+# Rank of each user role (see ProjectManager.user_status); unknown roles rank 0
+_ROLE_RANK = {
+    'viewer': 1,
+    'adder': 2,
+    'admin': 3,
+    'manager': 4,
+    'owner': 5,
+    'creator': 6,
+}
+
+# Minimum role rank for each permission level
+_VIEW_MIN = 1
+_EDIT_MIN = 2
+_ADMIN_MIN = 3
+
 
 class ProjectManager:
     """
@@ -41,9 +56,12 @@ class ProjectManager:
         self.logger = PluginLogger.get_logger()
 
         self.companies: List[Company] = []
+        self._companies_by_id: Dict[int, Company] = {}
+        self._project_index: Dict[int, Tuple[Project, Company]] = {}
         self.active_project: Optional[Project] = None
         self.active_company: Optional[Company] = None
         self.user_status: Optional[str] = None
+        self._role_rank: int = 0
         self.can_create: bool = False
         # Keep for backwards compatibility
         self.permissions: Dict[str, Permission] = {}
@@ -63,60 +81,80 @@ class ProjectManager:
         # Group projects by company
         company_projects: Dict[int, List[Project]] = {}
         company_names: Dict[int, str] = {}
+        name_to_id: Dict[str, int] = {}
 
         for ac in user_context.accessible_companies:
             company_names[ac.id] = ac.name
-            company_projects[ac.id] = []
+            # First company wins on duplicate names (matches previous scan order)
+            name_to_id.setdefault(ac.name, ac.id)
 
         for ap in user_context.accessible_projects:
             # Find company ID for this project
-            for ac in user_context.accessible_companies:
-                if ac.name == ap.company:
-                    project = Project(
-                        id=ap.id,
-                        name=ap.name,
-                        company_id=ac.id,
-                        company_name=ap.company,
-                        crs=ap.crs
-                    )
-                    company_projects[ac.id].append(project)
-                    break
-
-        # Build company list
-        self.companies = []
-        for company_id, projects in company_projects.items():
-            company = Company(
-                id=company_id,
-                name=company_names.get(company_id, ''),
-                projects=projects
-            )
-            self.companies.append(company)
+            cid = name_to_id.get(ap.company)
+            if cid is None:
+                continue
+            company_projects.setdefault(cid, []).append(self._project_from_api(ap, cid))
+
+        # Build company list (companies without projects get an empty list)
+        self._set_companies([
+            Company(id=cid, name=name, projects=company_projects.get(cid, []))
+            for cid, name in company_names.items()
+        ])
 
         # Set user status and permissions
-        self.user_status = user_context.user_status
+        self._set_user_status(user_context.user_status)
         self.can_create = user_context.can_create
 
         # Set active project/company from context
         if user_context.active_project:
-            ap = user_context.active_project
-            self.active_project = Project(
-                id=ap.id,
-                name=ap.name,
-                company_id=user_context.active_company.id if user_context.active_company else 0,
-                company_name=ap.company,
-                crs=ap.crs
+            self.active_project = self._project_from_api(
+                user_context.active_project,
+                user_context.active_company.id if user_context.active_company else 0
             )
 
         if user_context.active_company:
-            ac = user_context.active_company
             # Find the full company object
-            for company in self.companies:
-                if company.id == ac.id:
-                    self.active_company = company
-                    break
+            company = self._companies_by_id.get(user_context.active_company.id)
+            if company:
+                self.active_company = company
 
         self.logger.info(f"Loaded {len(self.companies)} companies from user context")
 
+    def _set_companies(self, companies: List[Company]) -> None:
+        """
+        Replace the loaded companies and rebuild the lookup indexes.
+
+        Always assign companies through this method so the id indexes
+        used by get_projects_for_company and restore_from_project_vars
+        stay in sync with self.companies.
+
+        Args:
+            companies: Companies with their projects
+        """
+        self.companies = companies
+        self._companies_by_id = {c.id: c for c in companies}
+        self._project_index = {p.id: (p, c) for c in companies for p in c.projects}
+
+    @staticmethod
+    def _project_from_api(ap, company_id: int) -> Project:
+        """
+        Build a Project from a user context project entry.
+
+        Args:
+            ap: Project from UserContext (accessible or active project)
+            company_id: ID of the owning company
+
+        Returns:
+            Project instance
+        """
+        return Project(
+            id=ap.id,
+            name=ap.name,
+            company_id=company_id,
+            company_name=ap.company,
+            crs=ap.crs
+        )
+
     def load_companies(self) -> List[Company]:
         """
         Load user's companies and projects from API.
@@ -162,19 +200,19 @@ class ProjectManager:
 
             # Notify server of project selection
             response = self.api_client.set_active_project(project.id)
-            user_context = UserContext.from_api_response(response)
+            # Only permissions and the active company are used here
+            user_context = UserContext.from_api_response_light(response)
 
             # Update local state
             self.active_project = project
-            self.user_status = user_context.user_status
+            self._set_user_status(user_context.user_status)
             self.can_create = user_context.can_create
 
             # Update company if changed
             if user_context.active_company:
-                for company in self.companies:
-                    if company.id == user_context.active_company.id:
-                        self.active_company = company
-                        break
+                company = self._companies_by_id.get(user_context.active_company.id)
+                if company:
+                    self.active_company = company
 
             # Store in QGIS project variables
             self._save_to_project_vars(project)
@@ -208,13 +246,13 @@ class ProjectManager:
             self.load_from_user_context(user_context)
 
             # Find and return the updated company object
-            for c in self.companies:
-                if c.id == company.id:
-                    self.active_company = c
-                    self.logger.info(
-                        f"Company selected: {c.name} with {len(c.projects)} projects"
-                    )
-                    return c
+            c = self._companies_by_id.get(company.id)
+            if c:
+                self.active_company = c
+                self.logger.info(
+                    f"Company selected: {c.name} with {len(c.projects)} projects"
+                )
+                return c
 
             self.logger.warning(f"Company {company.id} not found after reload")
             return None
@@ -223,6 +261,11 @@ class ProjectManager:
             self.logger.error(f"Failed to select company: {e}")
             raise
 
+    def _set_user_status(self, user_status: Optional[str]) -> None:
+        """Set the user's role and its cached permission rank."""
+        self.user_status = user_status
+        self._role_rank = _ROLE_RANK.get(user_status, 0)
+
     def get_permission_level(self) -> Optional[str]:
         """
         Get user's permission level for the current project.
@@ -233,15 +276,15 @@ class ProjectManager:
 
     def can_view_data(self) -> bool:
         """Check if user can view data."""
-        return self.user_status in ['creator', 'owner', 'manager', 'admin', 'adder', 'viewer']
+        return self._role_rank >= _VIEW_MIN
 
     def can_edit_data(self) -> bool:
         """Check if user can edit data."""
-        return self.user_status in ['creator', 'owner', 'manager', 'admin', 'adder']
+        return self._role_rank >= _EDIT_MIN
 
     def can_admin_data(self) -> bool:
         """Check if user has admin access."""
-        return self.user_status in ['creator', 'owner', 'manager', 'admin']
+        return self._role_rank >= _ADMIN_MIN
 
     def can_create_records(self) -> bool:
         """Check if user can create new records."""
@@ -288,10 +331,8 @@ class ProjectManager:
 
     def get_projects_for_company(self, company_id: int) -> List[Project]:
         """Get projects for a specific company."""
-        for company in self.companies:
-            if company.id == company_id:
-                return company.projects
-        return []
+        company = self._companies_by_id.get(company_id)
+        return company.projects if company else []
 
     def restore_from_project_vars(self) -> Optional[Project]:
         """
@@ -312,39 +353,35 @@ class ProjectManager:
             return None
 
         # Find project in loaded companies
-        for company in self.companies:
-            for project in company.projects:
-                if project.id == project_id:
-                    self.active_project = project
-                    self.active_company = company
-                    self.logger.info(f"Restored project from vars: {project}")
-                    return project
+        entry = self._project_index.get(project_id)
+        if entry is None:
+            return None
 
-        return None
+        project, company = entry
+        self.active_project = project
+        self.active_company = company
+        self.logger.info(f"Restored project from vars: {project}")
+        return project
 
     def _save_to_project_vars(self, project: Project):
         """Save project selection to QGIS project variables."""
         qgs_project = QgsProject.instance()
 
-        qgs_project.writeEntry(
-            self.PROJECT_VAR_SECTION,
-            self.PROJECT_VAR_KEY,
-            project.name
-        )
-        qgs_project.writeEntry(
-            self.PROJECT_VAR_SECTION,
-            self.COMPANY_VAR_KEY,
-            project.company_name
-        )
-        qgs_project.writeEntry(
-            self.PROJECT_VAR_SECTION,
-            self.PROJECT_ID_KEY,
-            project.id
-        )
-        qgs_project.writeEntry(
-            self.PROJECT_VAR_SECTION,
-            self.PROJECT_CRS_KEY,
-            project.crs
+        entries = (
+            (self.PROJECT_VAR_KEY, project.name),
+            (self.COMPANY_VAR_KEY, project.company_name),
+            (self.PROJECT_ID_KEY, project.id),
+            (self.PROJECT_CRS_KEY, project.crs),
         )
 
+        # Suppress per-entry dirty notifications, then mark the project
+        # dirty once so observers only react to the selection a single time
+        blocker = QgsProjectDirtyBlocker(qgs_project)
+        try:
+            for key, value in entries:
+                qgs_project.writeEntry(self.PROJECT_VAR_SECTION, key, value)
+        finally:
+            del blocker
+        qgs_project.setDirty(True)
+
         self.logger.debug("Saved project to QGIS project variables")
@@ -6,14 +6,36 @@ Handles GeoPackage and memory layer storage, with per-project
 storage preferences and path mappings.
 """
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from qgis.core import QgsSettings, QgsApplication
+from qgis.core import QgsSettings, QgsApplication, QgsProject
 from qgis.PyQt.QtCore import QStandardPaths
 
 from ..utils.logger import PluginLogger
 
+# Characters not allowed in suggested GeoPackage filenames
+_FILENAME_SANITIZE = re.compile(r'[^\w -]')
+
+
+@lru_cache(maxsize=1024)
+def _suggested_filename(project_name: str, project_id: int) -> str:
+    """Build a filesystem-safe GeoPackage filename for a project."""
+    safe_name = _FILENAME_SANITIZE.sub('_', project_name).strip()
+    safe_name = safe_name.replace(' ', '_')
+
+    return f"{safe_name}_{project_id}.gpkg"
+
+
+# Layer names created by the plugin for geodb models
+GEODB_MODEL_NAMES = frozenset({
+    'DrillCollar', 'DrillSample', 'DrillPad', 'DrillLithology',
+    'DrillAlteration', 'DrillStructure', 'DrillMineralization',
+    'DrillSurvey', 'DrillPhoto', 'LandHolding', 'PointSample', 'Photo'
+})
+
 
 class StorageMode:
     """Storage mode constants."""
@@ -39,6 +61,11 @@ class StorageManager:
         self.logger = PluginLogger.get_logger()
         self.settings = QgsSettings()
         self._current_project_id: Optional[int] = None
+        # Per-project settings (mode, gpkg_path, configured), read on first use
+        self._config_cache: Dict[int, Dict[str, Any]] = {}
+        self._config_cache_primed = False
+        # Resolved default GeoPackage directory (see get_default_directory)
+        self._default_dir_cache: Optional[Path] = None
 
     def get_default_directory(self) -> Path:
         """
@@ -49,10 +76,15 @@ class StorageManager:
         Returns:
             Path to default storage directory
         """
+        # Re-resolve if the folder was deleted or unmounted since it was cached
+        if self._default_dir_cache is not None and self._default_dir_cache.is_dir():
+            return self._default_dir_cache
+
         # Check if user has set a custom default
         custom_default = self.settings.value(self.DEFAULT_DIR_KEY, '')
         if custom_default and os.path.isdir(custom_default):
-            return Path(custom_default)
+            self._default_dir_cache = Path(custom_default)
+            return self._default_dir_cache
 
         # Use platform-appropriate Documents folder
         docs_path = QStandardPaths.writableLocation(
@@ -73,6 +105,7 @@ class StorageManager:
                 )) / 'GeodbData'
                 default_dir.mkdir(parents=True, exist_ok=True)
 
+        self._default_dir_cache = default_dir
         return default_dir
 
     def set_default_directory(self, path: str) -> bool:
@@ -87,6 +120,7 @@ class StorageManager:
         """
         if os.path.isdir(path):
             self.settings.setValue(self.DEFAULT_DIR_KEY, path)
+            self._default_dir_cache = Path(path)
             self.logger.info(f"Set default storage directory: {path}")
             return True
         return False
@@ -101,8 +135,7 @@ class StorageManager:
         Returns:
             StorageMode.MEMORY or StorageMode.GEOPACKAGE
         """
-        key = f'{self.PROJECT_STORAGE_KEY}/{project_id}/mode'
-        return self.settings.value(key, StorageMode.MEMORY)
+        return self._get_project_settings(project_id)['mode']
 
     def set_storage_mode(self, project_id: int, mode: str):
         """
@@ -114,6 +147,7 @@ class StorageManager:
         """
         key = f'{self.PROJECT_STORAGE_KEY}/{project_id}/mode'
         self.settings.setValue(key, mode)
+        self._config_cache.pop(project_id, None)
         self.logger.info(f"Set storage mode for project {project_id}: {mode}")
 
     def get_geopackage_path(self, project_id: int) -> Optional[Path]:
@@ -126,8 +160,7 @@ class StorageManager:
         Returns:
             Path to GeoPackage file, or None if not set
         """
-        key = f'{self.PROJECT_STORAGE_KEY}/{project_id}/gpkg_path'
-        path_str = self.settings.value(key, '')
+        path_str = self._get_project_settings(project_id)['gpkg_path']
 
         if path_str:
             return Path(path_str)
@@ -143,6 +176,7 @@ class StorageManager:
         """
         key = f'{self.PROJECT_STORAGE_KEY}/{project_id}/gpkg_path'
         self.settings.setValue(key, str(path))
+        self._config_cache.pop(project_id, None)
         self.logger.info(f"Set GeoPackage path for project {project_id}: {path}")
 
     def get_suggested_filename(self, project_name: str, project_id: int) -> str:
@@ -156,14 +190,7 @@ class StorageManager:
         Returns:
             Suggested filename (without path)
         """
-        # Sanitize project name for filename
-        safe_name = "".join(
-            c if c.isalnum() or c in (' ', '-', '_') else '_'
-            for c in project_name
-        ).strip()
-        safe_name = safe_name.replace(' ', '_')
-
-        return f"{safe_name}_{project_id}.gpkg"
+        return _suggested_filename(project_name, project_id)
 
     def get_suggested_path(self, project_name: str, project_id: int) -> Path:
         """
@@ -190,8 +217,7 @@ class StorageManager:
         Returns:
             True if storage has been configured (not just default memory)
         """
-        key = f'{self.PROJECT_STORAGE_KEY}/{project_id}/configured'
-        return self.settings.value(key, False, type=bool)
+        return self._get_project_settings(project_id)['configured']
 
     def mark_configured(self, project_id: int):
         """
@@ -202,6 +228,59 @@ class StorageManager:
         """
         key = f'{self.PROJECT_STORAGE_KEY}/{project_id}/configured'
         self.settings.setValue(key, True)
+        self._config_cache.pop(project_id, None)
+
+    def _get_project_settings(self, project_id: int) -> Dict[str, Any]:
+        """
+        Get the raw stored settings for a project, reading QSettings once.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Dictionary with mode, gpkg_path and configured values
+        """
+        if not self._config_cache_primed:
+            self._prime_config_cache()
+
+        cached = self._config_cache.get(project_id)
+        if cached is not None:
+            return cached
+
+        self.settings.beginGroup(f'{self.PROJECT_STORAGE_KEY}/{project_id}')
+        try:
+            cached = self._read_project_group()
+        finally:
+            self.settings.endGroup()
+
+        self._config_cache[project_id] = cached
+        return cached
+
+    def _prime_config_cache(self):
+        """Load settings for every configured project in one settings traversal."""
+        self._config_cache_primed = True
+        self.settings.beginGroup(self.PROJECT_STORAGE_KEY)
+        try:
+            for group in self.settings.childGroups():
+                try:
+                    project_id = int(group)
+                except ValueError:
+                    continue
+                self.settings.beginGroup(group)
+                try:
+                    self._config_cache[project_id] = self._read_project_group()
+                finally:
+                    self.settings.endGroup()
+        finally:
+            self.settings.endGroup()
+
+    def _read_project_group(self) -> Dict[str, Any]:
+        """Read storage settings from the currently open project group."""
+        return {
+            'mode': self.settings.value('mode', StorageMode.MEMORY),
+            'gpkg_path': self.settings.value('gpkg_path', ''),
+            'configured': self.settings.value('configured', False, type=bool),
+        }
 
     def get_storage_config(self, project_id: int) -> Dict[str, Any]:
         """
@@ -213,14 +292,13 @@ class StorageManager:
         Returns:
             Dictionary with mode, path, and configured status
         """
-        mode = self.get_storage_mode(project_id)
-        gpkg_path = self.get_geopackage_path(project_id)
-        configured = self.is_configured(project_id)
+        stored = self._get_project_settings(project_id)
+        mode = stored['mode']
 
         return {
             'mode': mode,
-            'geopackage_path': str(gpkg_path) if gpkg_path else None,
-            'configured': configured,
+            'geopackage_path': str(Path(stored['gpkg_path'])) if stored['gpkg_path'] else None,
+            'configured': stored['configured'],
             'is_memory': mode == StorageMode.MEMORY,
             'is_geopackage': mode == StorageMode.GEOPACKAGE
         }
@@ -277,8 +355,29 @@ class StorageManager:
         prefix = f'{self.PROJECT_STORAGE_KEY}/{project_id}'
         # Remove all keys for this project
         self.settings.remove(prefix)
+        self._config_cache.pop(project_id, None)
         self.logger.info(f"Cleared storage config for project {project_id}")
 
+    def _iter_geodb_memory_layers(self):
+        """
+        Yield memory layers that hold geodb model data.
+
+        Yields:
+            QgsMapLayer for each non-empty geodb memory layer
+        """
+        layers = QgsProject.instance().mapLayers().values()
+        for layer in layers:
+            # Check if it's one of our layers (named after our models) first;
+            # the name check is cheaper than resolving the data provider
+            if layer.name() not in GEODB_MODEL_NAMES:
+                continue
+            # Check if it's a memory layer
+            provider = layer.dataProvider()
+            if provider is None or provider.name() != 'memory':
+                continue
+            if layer.featureCount() > 0:
+                yield layer
+
     def has_unsaved_memory_layers(self) -> bool:
         """
         Check if there are memory layers with geodb data that haven't been saved.
@@ -288,23 +387,7 @@ class StorageManager:
         Returns:
             True if there are unsaved memory layers
         """
-        from qgis.core import QgsProject
-
-        for layer in QgsProject.instance().mapLayers().values():
-            # Check if it's a memory layer
-            if layer.dataProvider() and layer.dataProvider().name() == 'memory':
-                # Check if it's one of our layers (has geodb sync metadata)
-                # We check for layers named after our models
-                layer_name = layer.name()
-                geodb_models = [
-                    'DrillCollar', 'DrillSample', 'DrillPad', 'DrillLithology',
-                    'DrillAlteration', 'DrillStructure', 'DrillMineralization',
-                    'DrillSurvey', 'DrillPhoto', 'LandHolding', 'PointSample', 'Photo'
-                ]
-                if layer_name in geodb_models and layer.featureCount() > 0:
-                    return True
-
-        return False
+        return next(self._iter_geodb_memory_layers(), None) is not None
 
     def get_memory_layer_names(self) -> list:
         """
@@ -313,18 +396,4 @@ class StorageManager:
         Returns:
             List of layer names
         """
-        from qgis.core import QgsProject
-
-        memory_layers = []
-        geodb_models = [
-            'DrillCollar', 'DrillSample', 'DrillPad', 'DrillLithology',
-            'DrillAlteration', 'DrillStructure', 'DrillMineralization',
-            'DrillSurvey', 'DrillPhoto', 'LandHolding', 'PointSample', 'Photo'
-        ]
-
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.dataProvider() and layer.dataProvider().name() == 'memory':
-                if layer.name() in geodb_models and layer.featureCount() > 0:
-                    memory_layers.append(layer.name())
-
-        return memory_layers
+        return [layer.name() for layer in self._iter_geodb_memory_layers()]
@@ -2,13 +2,28 @@
 """
 Low-level synchronization between API and QGIS layers.
 """
+import ast
 import json
 import hashlib
+import logging
+import math
+import re
+import time
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
-from qgis.core import QgsProject, QgsField
+from itertools import chain
+from qgis.core import (
+    QgsProject, QgsField, QgsEditorWidgetSetup, QgsAction, QgsFeatureRequest,
+    QgsVectorDataProvider
+)
 from qgis.PyQt.QtCore import QVariant
 
+try:
+    # Optional: faster snapshot (de)serialization when available
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..processors.geometry_processor import GeometryProcessor
 from ..processors.field_processor import FieldProcessor
 from ..processors.layer_processor import LayerProcessor
@@ -16,6 +31,179 @@ from ..models.schemas import get_schema, get_extended_schema, ModelSchema, Field
 from ..utils.config import Config
 from ..utils.logger import PluginLogger
 
+# Floating point numbers in WKT (including negative and scientific notation)
+_FLOAT_RE = re.compile(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?')
+
+# (E)WKT whose type header carries a Z / ZM tag (e.g. "SRID=4326;POINT Z (",
+# "LINESTRING ZM(", "GEOMETRYCOLLECTION(POINT Z (", "POINT Z EMPTY"). Anchored,
+# so matching stops within the header and never scans the coordinates.
+_WKT_Z_RE = re.compile(
+    r'\s*(?:SRID=\d+\s*;\s*)?[A-Z]+(?:\s*\(\s*[A-Z]+)*\s+ZM?\s*(?:\(|EMPTY)',
+    re.IGNORECASE
+)
+
+
+class _FloatMicros(int):
+    """
+    A float quantized to an int count of millionths (see _quantize_float).
+
+    Never equal to a plain int, so a field changing from 1.5 to 1500000 is
+    still a change, both for the hash and in compute_feature_delta.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(other) is _FloatMicros and int.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = int.__hash__
+
+
+def _quantize_float(value: float) -> Any:
+    """
+    Map a float to an int in millionths for hashing.
+
+    Equivalent to round(value, 6) for comparison purposes but cheaper and
+    serializes shorter. Values too large (or not finite) to scale safely
+    fall back to round(value, 6).
+    """
+    if -1e12 < value < 1e12:
+        return _FloatMicros(round(value * 1e6))
+    return round(value, 6)
+
+
+def _encode_hash_value(value: Any) -> bytes:
+    """
+    Serialize a normalized field value for the feature hash.
+
+    Each encoding starts with a type byte (s = text, n = NULL, i = int,
+    f = quantized float, j = JSON), so values of different types never
+    encode alike (e.g. the text "null" and a NULL, or 1.5 and 1500000).
+    """
+    if isinstance(value, str):
+        return b's' + value.encode('utf-8')
+    # Quantized floats and NULLs dominate; their JSON form is trivial
+    if value is None:
+        return b'n'
+    value_type = type(value)
+    if value_type is _FloatMicros:
+        return b'f' + int.__repr__(value).encode('ascii')
+    if value_type is int:
+        return b'i' + str(value).encode('ascii')
+    return b'j' + json.dumps(
+        value, sort_keys=True, default=str, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def _round_float_match(match) -> str:
+    """Round a matched number to exactly 6 decimals for consistency."""
+    # Always use exactly 6 decimal places for consistent comparison
+    return f"{float(match.group(0)):.6f}"
+
+
+# Shared 'Hidden' editor widget setup (see _hidden_widget_setup)
+_HIDDEN_WIDGET_SETUP = None
+
+
+def _hidden_widget_setup():
+    """
+    Get the shared QgsEditorWidgetSetup used to hide form fields.
+
+    Created on first use; setEditorWidgetSetup() copies it, so one
+    instance serves every field and layer.
+    """
+    global _HIDDEN_WIDGET_SETUP
+    if _HIDDEN_WIDGET_SETUP is None:
+        _HIDDEN_WIDGET_SETUP = QgsEditorWidgetSetup('Hidden', {})
+    return _HIDDEN_WIDGET_SETUP
+
+
+# DrillPad location -> 30m square polygon (mirrors
+# LayerProcessor._point_to_square_polygon, which builds the stored geometry)
+_METERS_PER_DEGREE_LAT = 111320
+_DRILLPAD_HALF_SIZE_M = 15.0
+_DRILLPAD_HALF_SIZE_LAT = _DRILLPAD_HALF_SIZE_M / _METERS_PER_DEGREE_LAT
+
+# Models whose layers may carry suffixes (e.g. PointSample_Soil_Au_ppb),
+# so layers and snapshots are matched by name prefix
+_PREFIX_MATCH_MODELS = frozenset({'PointSample', 'DrillSample'})
+
+# QGIS field type -> sync field type for layers read back from QGIS
+# (anything else is treated as a string)
+_QGS_TYPE_MAP = {
+    QVariant.Int: 'integer',
+    QVariant.Double: 'decimal',
+    QVariant.Bool: 'boolean',
+}
+
+# Static ValueMap dropdown options ({label: stored value}), shared by every
+# form configuration. Treat as read-only.
+# Values from geodb.io API: drill_hole_types in drill_models.py
+_HOLE_TYPE_OPTIONS = [
+    {'Diamond Core': 'DD'},
+    {'Reverse Circulation': 'RC'},
+    {'Direct Circulation': 'DC'},
+    {'Percussion': 'PC'},
+    {'Sonic': 'SN'},
+    {'Trench': 'TR'},
+    {'Other': 'OT'},
+]
+
+# Values from geodb.io API: drill_hole_status in drill_models.py
+_HOLE_STATUS_OPTIONS = [
+    {'Completed': 'CP'},
+    {'Abandoned': 'AB'},
+    {'Planned': 'PL'},
+    {'In Progress': 'IP'},
+]
+
+# Values from geodb.io API: drill_hole_size in model_variables.py
+_HOLE_SIZE_OPTIONS = [
+    {'AQ': 'AQ'},
+    {'BQ': 'BQ'},
+    {'NQ': 'NQ'},
+    {'NQ2': 'NQ2'},
+    {'HQ': 'HQ'},
+    {'HQ3': 'HQ3'},
+    {'PQ': 'PQ'},
+    {'Other': 'OT'},
+]
+
+_LENGTH_UNITS_OPTIONS = [
+    {'Meters': 'M'},
+    {'Feet': 'FT'},
+]
+
+_DRILLPAD_STATUS_OPTIONS = [
+    {'Planned': 'planned'},
+    {'Built': 'built'},
+    {'Historic': 'historic'},
+]
+
+# Values from geodb.io API: pointsample_types in model_variables.py
+_SAMPLE_TYPE_OPTIONS = [
+    {'Soil': 'SL'},
+    {'Rock Chip': 'RK'},
+    {'Outcrop': 'OC'},
+    {'Dump': 'DP'},
+    {'Stream Sediment': 'ST'},
+    {'BLEG': 'BG'},
+    {'Other': 'OT'},
+]
+
+_PHOTO_CATEGORY_OPTIONS = [
+    {'Drill Core': 'DRL'},
+    {'Map': 'MAP'},
+    {'Field': 'FLD'},
+    {'Aerial': 'AER'},
+    {'Geology': 'GEO'},
+    {'Sample': 'SMP'},
+    {'Equipment': 'EQP'},
+    {'Other': 'OTH'},
+]
+
 
 class SyncManager:
     """
@@ -26,8 +214,18 @@ class SyncManager:
     # QGIS project variable section for sync metadata
     SYNC_VAR_SECTION = "geodb_sync"
 
+    # Bump when the feature hash format changes; snapshots saved with an
+    # older format are ignored (the next pull stores a fresh snapshot)
+    SNAPSHOT_FORMAT_VERSION = 6
+
+    # Max entries kept in the normalized WKT memo
+    WKT_MEMO_LIMIT = 10000
+
+    # Seconds that dropdown lookup results (pads, lithologies, ...) stay cached
+    LOOKUP_CACHE_TTL = 300
+
     # Fields to exclude from change comparison (read-only server fields)
-    EXCLUDE_FROM_COMPARISON = {
+    EXCLUDE_FROM_COMPARISON = frozenset({
         # Timestamp/audit fields
         'created_at', 'updated_at', 'date_created', 'last_edited',
         'created_by', 'updated_by', 'last_edited_by',
@@ -61,7 +259,29 @@ class SyncManager:
         # Assay data (complex nested object with element values)
         'assay',
         # Note: Merged assay element fields (Au_ppm, Cu_ppb, etc.) are excluded
-        # dynamically in _compute_feature_hash() by checking for _ppm/_ppb/_pct/_%
+        # dynamically in _skip_for_comparison() by checking for _ppm/_ppb/_pct/_opt
+    })
+
+    # Dynamic read-only columns excluded by name pattern
+    EXCLUDE_PREFIXES = ('image_', 'document_')
+    EXCLUDE_SUFFIXES = ('_ppm', '_ppb', '_pct', '_opt')
+
+    # Form configurer per model: (method name, needs api_client/project_id)
+    WIDGET_CONFIGURERS = {
+        'LandHolding': ('_configure_landholding_widgets', False),
+        'DrillCollar': ('_configure_drillcollar_widgets', True),
+        'DrillPad': ('_configure_drillpad_widgets', False),
+        'PointSample': ('_configure_pointsample_widgets', True),
+    }
+
+    # Map schema field types to sync field types
+    SCHEMA_FIELD_TYPES = {
+        FieldType.STRING: 'string',
+        FieldType.INTEGER: 'integer',
+        FieldType.DOUBLE: 'decimal',
+        FieldType.BOOLEAN: 'boolean',
+        FieldType.DATE: 'string',  # Store as string for now
+        FieldType.DATETIME: 'string',
     }
 
     def __init__(self, config: Config):
@@ -85,6 +305,60 @@ class SyncManager:
         # In-memory cache of server snapshots (keyed by model_name -> id -> hash)
         self._server_snapshots: Dict[str, Dict[int, str]] = {}
 
+        # Normalized field values behind each snapshot hash (model_name -> id -> fields).
+        # Only kept in memory; used to send diff-only updates on push.
+        self._server_records: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
+        # Field layout each static form was last configured for (see _form_config_current)
+        self._widget_config_cache: Dict[str, Tuple[str, ...]] = {}
+
+        # Geometry type per layer model name (see _get_geometry_type_from_schema)
+        self._geometry_type_cache: Dict[str, Optional[str]] = {}
+
+        # Digest of the snapshot JSON last written per model (see _save_snapshot_to_project)
+        self._persisted_snapshots: Dict[str, bytes] = {}
+
+        # Memoized _skip_for_comparison() result per field name
+        self._skip_key_cache: Dict[str, bool] = {}
+
+        # Encoded "key\0" prefixes fed to the feature hash
+        self._hash_key_prefixes: Dict[str, bytes] = {}
+
+        # Comparable fields per feature field-name tuple (see _included_keys_for)
+        self._included_keys_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+        # Hash functions specialized per feature field-name tuple (see _hasher_for)
+        self._specialized_hashers: Dict[Tuple[str, ...], Callable[[Dict[str, Any]], str]] = {}
+
+        # Normalized WKT keyed by the raw WKT string (see _normalize_wkt)
+        self._wkt_memo: Dict[str, str] = {}
+
+        # Dropdown lookup options keyed by (endpoint, project_id), with fetch time
+        self._lookup_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, str]]]] = {}
+
+        # Exact-type handlers for _normalize_value_for_hash()
+        self._hash_normalizers: Dict[type, Callable[[Any], Any]] = {
+            bool: self._normalize_bool_for_hash,
+            int: self._normalize_int_for_hash,
+            float: self._normalize_float_for_hash,
+            str: self._normalize_str_for_hash,
+            dict: self._normalize_dict_for_hash,
+            list: self._normalize_list_for_hash,
+        }
+
+        # Layer ID and name per (model_name, project_name) resolved by _find_layer.
+        # Any layer added to or removed from the project invalidates it; an
+        # entry whose layer was renamed since is re-resolved on lookup.
+        self._layer_cache: Dict[Tuple[str, Optional[str]], Tuple[str, str]] = {}
+        # QgsProject.instance() is a process-wide singleton (layer lookup hot path)
+        self._project = QgsProject.instance()
+        self._project.layersAdded.connect(self._clear_layer_cache)
+        self._project.layersRemoved.connect(self._clear_layer_cache)
+
+    def _clear_layer_cache(self, *args):
+        """Forget resolved layer IDs (connected to project layer signals)."""
+        self._layer_cache.clear()
+
     def _compute_feature_hash(self, feature_data: Dict[str, Any]) -> str:
         """
         Compute a hash of feature data for change detection.
@@ -96,107 +370,342 @@ class SyncManager:
             feature_data: Feature dictionary
 
         Returns:
-            MD5 hash string
+            Hex digest string (32 chars)
         """
-        # Create a normalized dict for hashing
-        hash_data = {}
+        field_names = tuple(feature_data)
+        hasher = self._specialized_hashers.get(field_names)
+        if hasher is None:
+            hasher = self._specialized_hashers[field_names] = self._hasher_for(field_names)
+        return hasher(feature_data)
 
-        for key, value in feature_data.items():
-            # Skip excluded fields
-            if key in self.EXCLUDE_FROM_COMPARISON:
-                continue
+    def _hasher_for(self, field_names: Tuple[str, ...]) -> Callable[[Dict[str, Any]], str]:
+        """
+        Build a hash function for features with the given field names.
 
-            # Skip dynamic image/document columns (read-only display fields)
-            if key.startswith('image_') or key.startswith('document_'):
-                continue
+        The comparable keys and their encoded prefixes are resolved once, so
+        the returned function walks a fixed plan without building, sorting
+        or filtering a dict per feature. Produces the same digest as
+        _digest_hash_data(_build_hash_data(feature_data)).
+
+        Args:
+            field_names: Field names of a feature, in dict order
+
+        Returns:
+            Function mapping a feature dictionary to its hex digest
+        """
+        included = self._included_keys_cache.get(field_names)
+        if included is None:
+            included = self._included_keys_for(field_names)
+        plan = tuple((key, key.encode('utf-8') + b'\x00') for key in included)
+        normalize = self._normalize_value_for_hash
+        blake2b = hashlib.blake2b
+
+        def hasher(feature_data: Dict[str, Any]) -> str:
+            parts = []
+            append = parts.append
+            for key, prefix in plan:
+                append(prefix)
+                append(_encode_hash_value(normalize(feature_data[key])))
+                append(b'\x01')
+            return blake2b(b''.join(parts), digest_size=16).hexdigest()
+
+        return hasher
 
-            # Skip merged assay element fields (read-only, format: Element_units)
-            # Units: ppm, ppb, pct (percent), opt (ounces per ton)
-            # e.g., Au_ppm, Cu_ppb, Fe_pct, Ag_opt
-            if key.endswith(('_ppm', '_ppb', '_pct', '_opt')):
+    def _compute_feature_hashes_bulk(self, features: List[Dict[str, Any]]) -> List[str]:
+        """
+        Compute change-detection hashes for many features at once.
+
+        Args:
+            features: Feature dictionaries
+
+        Returns:
+            Hex digests, in the same order as features
+        """
+        return self._hash_features_bulk(features, keep_records=False)[0]
+
+    def _hash_features_bulk(
+        self,
+        features: List[Dict[str, Any]],
+        keep_records: bool = True
+    ) -> Tuple[List[str], Optional[List[Dict[str, Any]]]]:
+        """
+        Normalize and hash many features at once.
+
+        Features are grouped by field layout and normalized column by
+        column (one map() over each field's values), then every row's
+        records are joined and hashed. Produces the same digests and
+        normalized data as _compute_feature_hash / _build_hash_data.
+
+        Args:
+            features: Feature dictionaries
+            keep_records: Also return each feature's normalized field values
+
+        Returns:
+            Tuple of (hex digests, normalized records or None), both in the
+            same order as features
+        """
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for idx, feature_data in enumerate(features):
+            groups.setdefault(tuple(feature_data), []).append(idx)
+
+        hashes: List[str] = [''] * len(features)
+        records: Optional[List[Dict[str, Any]]] = [None] * len(features) if keep_records else None
+        normalize = self._normalize_value_for_hash
+        blake2b = hashlib.blake2b
+        for field_names, indices in groups.items():
+            included = self._included_keys_cache.get(field_names)
+            if included is None:
+                included = self._included_keys_for(field_names)
+
+            rows: List[List[bytes]] = [[] for _ in indices]
+            row_records = [{} for _ in indices] if keep_records else None
+            for key in included:
+                prefix = key.encode('utf-8') + b'\x00'
+                values = [features[idx][key] for idx in indices]
+                if all(type(value) is float for value in values):
+                    # Pure float columns (assay values, coordinates) skip
+                    # the per-value type dispatch
+                    column = list(map(_quantize_float, values))
+                else:
+                    column = list(map(normalize, values))
+                for parts, encoded in zip(rows, map(_encode_hash_value, column)):
+                    parts.append(prefix)
+                    parts.append(encoded)
+                    parts.append(b'\x01')
+                if keep_records:
+                    for record, value in zip(row_records, column):
+                        record[key] = value
+
+            for pos, (idx, parts) in enumerate(zip(indices, rows)):
+                hashes[idx] = blake2b(b''.join(parts), digest_size=16).hexdigest()
+                if keep_records:
+                    records[idx] = row_records[pos]
+        return hashes, records
+
+    def _digest_hash_data(self, hash_data: Dict[str, Any]) -> str:
+        """Hash already-normalized field values (see _build_hash_data)."""
+        # Hash sorted "key\0value\1" records. They are collected into one
+        # buffer so the hash is fed with a single C call per feature.
+        key_prefixes = self._hash_key_prefixes
+        parts = []
+        for key in sorted(hash_data):
+            value = hash_data[key]
+            prefix = key_prefixes.get(key)
+            if prefix is None:
+                prefix = key_prefixes[key] = key.encode('utf-8') + b'\x00'
+            parts.append(prefix)
+            parts.append(_encode_hash_value(value))
+            parts.append(b'\x01')
+        # Change detection only - no cryptographic strength needed.
+        # BLAKE2b is in the standard library (no extra dependency in QGIS'
+        # Python) and outpaces MD5; 16 bytes keeps the 32-char hex width.
+        return hashlib.blake2b(b''.join(parts), digest_size=16).hexdigest()
+
+    def _build_hash_data(self, feature_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the normalized field values used for change detection.
+
+        Args:
+            feature_data: Feature dictionary
+
+        Returns:
+            Dict of comparable field name -> normalized value
+        """
+        field_names = tuple(feature_data)
+        included = self._included_keys_cache.get(field_names)
+        if included is None:
+            included = self._included_keys_for(field_names)
+
+        # Normalize the values for consistent hashing
+        normalize = self._normalize_value_for_hash
+        return {key: normalize(feature_data[key]) for key in included}
+
+    def _included_keys_for(self, field_names: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Get the comparable fields for a set of feature field names.
+
+        Features from the same layer share one field list, so the filtered
+        (and sorted) result is cached per field-name tuple.
+
+        Args:
+            field_names: Field names of a feature, in dict order
+
+        Returns:
+            Sorted tuple of field names that take part in change detection
+        """
+        included = tuple(sorted(
+            key for key in field_names if not self._skip_for_comparison(key)
+        ))
+        self._included_keys_cache[field_names] = included
+        return included
+
+    def _skip_for_comparison(self, key: str) -> bool:
+        """Return True if a field never takes part in change detection."""
+        skip = self._skip_key_cache.get(key)
+        if skip is None:
+            skip = (
+                # Excluded read-only server fields
+                key in self.EXCLUDE_FROM_COMPARISON or
+                # Dynamic image/document columns (read-only display fields)
+                key.startswith(self.EXCLUDE_PREFIXES) or
+                # Merged assay element fields (read-only, format: Element_units)
+                # Units: ppm, ppb, pct (percent), opt (ounces per ton)
+                # e.g., Au_ppm, Cu_ppb, Fe_pct, Ag_opt
+                key.endswith(self.EXCLUDE_SUFFIXES)
+            )
+            self._skip_key_cache[key] = skip
+        return skip
+
+    def compute_feature_delta(
+        self,
+        feature: Dict[str, Any],
+        server_record: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Get the fields of a feature that differ from the last-known server record.
+
+        Values are compared in their normalized form, so geometry is diffed by
+        normalized WKT equality. Fields excluded from change detection are
+        never part of the delta.
+
+        Args:
+            feature: Feature prepared for push
+            server_record: Normalized server record from get_changed_features()
+
+        Returns:
+            Dict containing only the changed fields (raw values from feature)
+        """
+        delta = {}
+        for key, value in feature.items():
+            if self._skip_for_comparison(key):
                 continue
+            if server_record.get(key) != self._normalize_value_for_hash(value):
+                delta[key] = value
+        return delta
 
-            # Normalize the value for consistent hashing
-            normalized = self._normalize_value_for_hash(value)
-            hash_data[key] = normalized
+    @staticmethod
+    def _unwrap_qvariants(feature_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert QVariant attribute values to plain Python types in place.
+
+        Called once where features are read from a QGIS layer, so the hash
+        normalization never has to deal with QVariant.
 
-        # Sort keys for consistent ordering
-        sorted_json = json.dumps(hash_data, sort_keys=True, default=str)
-        return hashlib.md5(sorted_json.encode('utf-8')).hexdigest()
+        Args:
+            feature_data: Feature dictionary built from layer attributes
+
+        Returns:
+            The same dictionary (NULL variants become None)
+        """
+        for key, value in feature_data.items():
+            if isinstance(value, QVariant):
+                feature_data[key] = None if value.isNull() else value.value()
+        return feature_data
 
     def _normalize_value_for_hash(self, value: Any) -> Any:
         """
         Normalize a value for consistent hashing.
 
         Handles special cases like geometry strings, None vs NULL, booleans,
-        timestamps, QVariant types, and natural key objects.
-        """
-        import ast
-        import re
-        from qgis.PyQt.QtCore import QVariant
+        timestamps, and natural key objects. QVariant values must already be
+        unwrapped (see _unwrap_qvariants).
 
-        # Handle QVariant from QGIS - convert to Python type first
-        if isinstance(value, QVariant):
-            if value.isNull():
-                return None
-            # Convert to Python type
-            value = value.value() if hasattr(value, 'value') else value
+        Plain Python types are dispatched on type(value) to a dedicated
+        normalizer; everything else (QDate, None, subclasses) takes the
+        slower generic path.
+        """
+        handler = self._hash_normalizers.get(type(value))
+        if handler is not None:
+            return handler(value)
+        return self._normalize_other_for_hash(value)
 
-        if value is None or value == '' or str(value) == 'NULL':
+    def _normalize_other_for_hash(self, value: Any) -> Any:
+        """Normalize values without an exact-type handler (see _normalize_value_for_hash)."""
+        if value is None or str(value) == 'NULL':
             return None
 
-        # Normalize booleans to lowercase JSON strings
-        if isinstance(value, bool):
-            return 'true' if value else 'false'
+        # Normalize date/datetime values
+        # Handle QDate objects from QGIS
+        if hasattr(value, 'toString') and hasattr(value, 'year'):
+            # QDate or QDateTime object
+            if hasattr(value, 'time'):
+                # QDateTime
+                return value.toString('yyyy-MM-dd HH:mm:ss')
+            else:
+                # QDate
+                return value.toString('yyyy-MM-dd')
+
+        # Subclasses of the dispatched types (bool before int)
+        for base_type in (bool, int, float, str, dict, list):
+            if isinstance(value, base_type):
+                return self._hash_normalizers[base_type](value)
 
+        return value
+
+    def _normalize_bool_for_hash(self, value: bool) -> str:
+        """Normalize booleans to lowercase JSON strings."""
+        return 'true' if value else 'false'
+
+    def _normalize_int_for_hash(self, value: int) -> int:
+        """Keep integers as int."""
+        return value
+
+    def _normalize_float_for_hash(self, value: float) -> Any:
+        """Quantize floats to millionths to avoid precision issues."""
+        return _quantize_float(value)
+
+    def _normalize_list_for_hash(self, value: list) -> str:
+        """Convert lists to sorted JSON strings."""
+        return json.dumps(value, sort_keys=True, default=str)
+
+    def _normalize_dict_for_hash(self, value: dict) -> str:
+        """Normalize GeoJSON geometry to WKT and other dicts to sorted JSON."""
         # Handle GeoJSON geometry dicts - convert to WKT for consistent hashing
         # API returns geometry as GeoJSON: {"type": "MultiPolygon", "coordinates": [...]}
         # QGIS returns geometry as EWKT: "SRID=4326;MULTIPOLYGON(...)"
         # We normalize both to uppercase WKT for comparison
-        if isinstance(value, dict) and 'type' in value and 'coordinates' in value:
+        if 'type' in value and 'coordinates' in value:
+            # Common types are built already rounded, uppercase and single-spaced
+            try:
+                wkt = self._build_wkt_from_coordinates(
+                    str(value['type']).upper(), value['coordinates'], precision=6
+                )
+            except Exception:
+                wkt = None
+            if wkt:
+                return wkt
+
             wkt = self._geojson_dict_to_wkt(value)
             if wkt:
-                # Round and normalize the WKT
-                wkt = self._round_coordinates_in_wkt(wkt)
-                wkt = re.sub(r'\(\s+', '(', wkt)
-                wkt = re.sub(r'\s+\)', ')', wkt)
-                wkt = re.sub(r'\s+', ' ', wkt)
-                return wkt.upper().strip()
+                return self._normalize_wkt(wkt)
             # If conversion fails, fall through to dict handling below
 
-        # For geometry strings (WKT/EWKT), normalize to uppercase WKT
-        if isinstance(value, str) and (
-            value.upper().startswith('SRID=') or
-            value.upper().startswith(('POINT', 'LINESTRING', 'POLYGON', 'MULTI'))
-        ):
+        # Convert dicts to sorted JSON strings
+        return json.dumps(value, sort_keys=True, default=str)
+
+    def _normalize_str_for_hash(self, value: str) -> Any:
+        """Normalize geometry, date, JSON and numeric strings."""
+        if value == '' or value == 'NULL':
+            return None
+
+        # For geometry strings (WKT/EWKT), normalize to uppercase WKT.
+        # Check the first character before uppercasing so ordinary strings
+        # never pay for a full-length upper() copy.
+        head = value[:10].upper() if value[0] in 'SsPpLlMm' else ''
+        if head.startswith(('SRID=', 'POINT', 'LINESTRING', 'POLYGON', 'MULTI')):
             # Strip SRID prefix if present
-            if value.upper().startswith('SRID='):
+            if head.startswith('SRID='):
                 semicolon_idx = value.find(';')
                 if semicolon_idx != -1:
                     value = value[semicolon_idx + 1:].strip()
 
-            # Round coordinates to 6 decimal places
-            value = self._round_coordinates_in_wkt(value)
+            return self._normalize_wkt(value)
 
-            # Normalize whitespace and case
-            value = re.sub(r'\(\s+', '(', value)  # Remove space after (
-            value = re.sub(r'\s+\)', ')', value)  # Remove space before )
-            value = re.sub(r'\s+', ' ', value)    # Normalize multiple spaces
-            return value.upper().strip()
-
-        # Normalize date/datetime values
-        # Handle QDate objects from QGIS
-        if hasattr(value, 'toString') and hasattr(value, 'year'):
-            # QDate or QDateTime object
-            if hasattr(value, 'time'):
-                # QDateTime
-                return value.toString('yyyy-MM-dd HH:mm:ss')
-            else:
-                # QDate
-                return value.toString('yyyy-MM-dd')
-
-        # Normalize ISO datetime strings
-        if isinstance(value, str) and ('T' in value and ('Z' in value or '+' in value or value.count(':') >= 2)):
+        # Normalize ISO datetime strings (the 'T' separator follows the date)
+        if (
+            len(value) >= 10 and 'T' in value[:20] and
+            ('Z' in value or '+' in value or value.count(':') >= 2)
+        ):
             try:
                 # Try parsing as ISO datetime
                 dt_str = value.replace('Z', '+00:00')
@@ -213,7 +722,7 @@ class SyncManager:
                 pass
 
         # Normalize date-only strings (YYYY-MM-DD)
-        if isinstance(value, str) and len(value) == 10 and value.count('-') == 2:
+        if len(value) == 10 and value.count('-') == 2:
             try:
                 # Validate it's a valid date
                 parts = value.split('-')
@@ -225,53 +734,74 @@ class SyncManager:
             except:
                 pass
 
-        # Try to parse string representations of dicts/lists back to objects
-        if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
+        # Try to parse string representations of dicts/lists back to objects.
+        # Only bracket-delimited strings can parse as a container, and only
+        # strings with single quotes need the (slow) Python literal parser.
+        first = value[0]
+        if (first == '{' and value[-1] == '}') or (first == '[' and value[-1] == ']'):
+            parsed = None
             try:
                 # Try JSON first
                 parsed = json.loads(value)
-                value = parsed
             except json.JSONDecodeError:
-                try:
-                    # Try Python literal_eval for {'key': 'value'} format
-                    parsed = ast.literal_eval(value)
-                    if isinstance(parsed, (dict, list)):
-                        value = parsed
-                except (ValueError, SyntaxError):
-                    pass
-
-        # Convert dicts/lists to sorted JSON strings
-        if isinstance(value, (dict, list)):
-            return json.dumps(value, sort_keys=True, default=str)
-
-        # Normalize numeric types for consistent comparison
-        # Handle integers (could be stored as int or string)
-        if isinstance(value, int) and not isinstance(value, bool):
-            return value  # Keep as int
-
-        # Round floats to avoid precision issues
-        if isinstance(value, float):
-            return round(value, 6)
+                if "'" in value:
+                    try:
+                        # Try Python literal_eval for {'key': 'value'} format
+                        parsed = ast.literal_eval(value)
+                    except (ValueError, SyntaxError):
+                        pass
+            if isinstance(parsed, (dict, list)):
+                # Convert dicts/lists to sorted JSON strings
+                return json.dumps(parsed, sort_keys=True, default=str)
 
         # Try to convert string representations of numbers
-        if isinstance(value, str):
-            stripped = value.strip()
-            # Try integer conversion
+        stripped = value.strip()
+        # Try integer conversion
+        try:
+            if stripped.isdigit() or (stripped.startswith('-') and stripped[1:].isdigit()):
+                return int(stripped)
+        except (ValueError, IndexError):
+            pass
+        # Try float conversion (but only if it looks like a float)
+        if '.' in stripped:
             try:
-                if stripped.isdigit() or (stripped.startswith('-') and stripped[1:].isdigit()):
-                    return int(stripped)
-            except (ValueError, IndexError):
+                return _quantize_float(float(stripped))
+            except ValueError:
                 pass
-            # Try float conversion (but only if it looks like a float)
-            if '.' in stripped:
-                try:
-                    float_val = float(stripped)
-                    return round(float_val, 6)
-                except ValueError:
-                    pass
 
         return value
 
+    def _normalize_wkt(self, wkt_string: str) -> str:
+        """
+        Normalize a WKT string for hashing.
+
+        Rounds coordinates to 6 decimals, collapses whitespace runs, drops
+        whitespace next to parentheses and uppercases the result. Results
+        are memoized by input string, since shared geometries (e.g. a claim
+        shape reused by several features) repeat within a sync.
+
+        Args:
+            wkt_string: WKT geometry string (without SRID prefix)
+
+        Returns:
+            Normalized WKT string
+        """
+        cached = self._wkt_memo.get(wkt_string)
+        if cached is not None:
+            return cached
+
+        wkt = self._round_coordinates_in_wkt(wkt_string)
+        # split()/join() collapses and strips every whitespace run in one C
+        # pass; afterwards at most a single space can touch a parenthesis.
+        wkt = ' '.join(wkt.split())
+        wkt = wkt.replace('( ', '(').replace(' )', ')').upper()
+
+        if len(self._wkt_memo) >= self.WKT_MEMO_LIMIT:
+            # Drop the oldest entry (dicts keep insertion order)
+            del self._wkt_memo[next(iter(self._wkt_memo))]
+        self._wkt_memo[wkt_string] = wkt
+        return wkt
+
     def _round_coordinates_in_wkt(self, wkt_string: str) -> str:
         """
         Round all coordinate values in WKT string to 6 decimal places.
@@ -282,23 +812,14 @@ class SyncManager:
         Returns:
             WKT string with rounded coordinates (always 6 decimal places)
         """
-        import re
-
-        def round_match(match):
-            """Round a matched number to exactly 6 decimals for consistency."""
-            num = float(match.group(0))
-            # Always use exactly 6 decimal places for consistent comparison
-            return f"{num:.6f}"
-
-        # Match floating point numbers (including negative and scientific notation)
-        pattern = r'-?\d+\.?\d*(?:[eE][+-]?\d+)?'
-        return re.sub(pattern, round_match, wkt_string)
+        return _FLOAT_RE.sub(_round_float_match, wkt_string)
 
     def _geojson_dict_to_wkt(self, geojson: Dict[str, Any]) -> Optional[str]:
         """
         Convert a GeoJSON geometry dict to WKT string.
 
-        Uses OGR for reliable conversion, with fallback to manual conversion.
+        Builds WKT directly from the coordinates for common geometry types,
+        falling back to OGR for anything else (e.g., GeometryCollection).
 
         Args:
             geojson: GeoJSON geometry dict with 'type' and 'coordinates'
@@ -309,8 +830,18 @@ class SyncManager:
         if not geojson or 'type' not in geojson or 'coordinates' not in geojson:
             return None
 
+        # Direct conversion for common geometry types
         try:
-            # Try OGR first (most reliable)
+            wkt = self._build_wkt_from_coordinates(
+                geojson['type'].upper(), geojson['coordinates']
+            )
+            if wkt:
+                return wkt
+        except Exception as e:
+            self.logger.debug(f"Manual GeoJSON to WKT conversion failed: {e}")
+
+        try:
+            # Fall back to OGR for unsupported types
             from osgeo import ogr
             geojson_str = json.dumps(geojson)
             ogr_geom = ogr.CreateGeometryFromJson(geojson_str)
@@ -321,123 +852,105 @@ class SyncManager:
         except Exception:
             pass
 
-        # Fallback: manual conversion for common geometry types
-        try:
-            geom_type = geojson['type'].upper()
-            coords = geojson['coordinates']
-
-            if geom_type == 'POINT':
-                if len(coords) >= 3:
-                    return f"POINT Z ({coords[0]} {coords[1]} {coords[2]})"
-                return f"POINT ({coords[0]} {coords[1]})"
-
-            elif geom_type == 'MULTIPOLYGON':
-                polygons = []
-                for polygon in coords:
-                    rings = []
-                    for ring in polygon:
-                        points = ', '.join(f"{p[0]} {p[1]}" for p in ring)
-                        rings.append(f"({points})")
-                    polygons.append(f"({', '.join(rings)})")
-                return f"MULTIPOLYGON ({', '.join(polygons)})"
-
-            elif geom_type == 'POLYGON':
-                rings = []
-                for ring in coords:
-                    points = ', '.join(f"{p[0]} {p[1]}" for p in ring)
-                    rings.append(f"({points})")
-                return f"POLYGON ({', '.join(rings)})"
-
-            elif geom_type == 'LINESTRING':
-                points = ', '.join(f"{p[0]} {p[1]}" for p in coords)
-                return f"LINESTRING ({points})"
-
-            elif geom_type == 'MULTIPOINT':
-                points = ', '.join(f"({p[0]} {p[1]})" for p in coords)
-                return f"MULTIPOINT ({points})"
-
-        except Exception as e:
-            self.logger.debug(f"Manual GeoJSON to WKT conversion failed: {e}")
-
         return None
 
-    def _convert_geometry_to_ewkt(self, geom_value: Any, epsg_code: int) -> Optional[str]:
+    def _build_wkt_from_coordinates(
+        self,
+        geom_type: str,
+        coords: Any,
+        precision: Optional[int] = None
+    ) -> Optional[str]:
         """
-        Convert geometry from various formats to EWKT string.
-
-        This method handles:
-        - GeoJSON dict from API
-        - WKT/EWKT strings
-        - Already parsed EWKT strings (passed through)
+        Build WKT for a GeoJSON geometry type and coordinate array.
 
         Args:
-            geom_value: Geometry in any supported format
-            epsg_code: EPSG code to use for SRID prefix
+            geom_type: Uppercase GeoJSON type (POINT, POLYGON, ...)
+            coords: GeoJSON coordinates for that type
+            precision: If set, format every coordinate with exactly this many
+                decimals (the normalized form used for change detection)
 
         Returns:
-            EWKT string (e.g., "SRID=4326;MULTIPOLYGON(...)") or None if conversion fails
+            WKT string, or None if the type is not handled here
         """
-        if not geom_value:
-            return None
+        coord_format = '%s' if precision is None else f'%.{precision}f'
 
-        # If it's already an EWKT string, return as-is
-        if isinstance(geom_value, str):
-            if geom_value.upper().startswith('SRID='):
-                return geom_value
-            # If it's WKT without SRID, add the SRID prefix
-            if geom_value.upper().startswith(('POINT', 'LINESTRING', 'POLYGON', 'MULTI')):
-                return f"SRID={epsg_code};{geom_value}"
-
-        # If it's a GeoJSON dict, convert to WKT first then add SRID
-        if isinstance(geom_value, dict) and 'type' in geom_value and 'coordinates' in geom_value:
-            wkt = self._geojson_dict_to_wkt(geom_value)
-            if wkt:
-                return f"SRID={epsg_code};{wkt}"
+        def fmt_point(p):
+            return ' '.join([coord_format % c for c in p])
 
-        return None
+        def fmt_points(points):
+            # Format the whole coordinate list with one %-operation instead
+            # of one call per point (large rings have thousands of vertices)
+            if not points:
+                return ''
+            dim = len(points[0])
+            flat = tuple(chain.from_iterable(points))
+            if len(flat) != dim * len(points):
+                # Mixed dimensions - format point by point
+                return ', '.join([fmt_point(p) for p in points])
+            point_format = ' '.join([coord_format] * dim)
+            return ', '.join([point_format] * len(points)) % flat
 
-    def _get_max_document_counts(self, features: List[Dict]) -> Dict[str, int]:
-        """
-        Scan features to find max number of images and documents.
+        def fmt_rings(rings):
+            return ', '.join([f"({fmt_points(ring)})" for ring in rings])
 
-        Args:
-            features: List of feature dictionaries from API
+        if geom_type == 'POINT':
+            if len(coords) >= 3:
+                return f"POINT Z ({fmt_point(coords[:3])})"
+            return f"POINT ({fmt_point(coords[:2])})"
 
-        Returns:
-            Dict with 'images' and 'documents' counts
-        """
-        max_images = 0
-        max_docs = 0
-        for feature in features:
-            images = feature.get('images', [])
-            docs = feature.get('documents', [])
-            max_images = max(max_images, len(images))
-            max_docs = max(max_docs, len(docs))
-        return {'images': max_images, 'documents': max_docs}
+        elif geom_type == 'MULTIPOLYGON':
+            polygons = ', '.join([f"({fmt_rings(polygon)})" for polygon in coords])
+            return f"MULTIPOLYGON ({polygons})"
 
-    def _collect_all_assay_elements(self, features: List[Dict]) -> set:
+        elif geom_type == 'POLYGON':
+            return f"POLYGON ({fmt_rings(coords)})"
+
+        elif geom_type == 'LINESTRING':
+            return f"LINESTRING ({fmt_points(coords)})"
+
+        elif geom_type == 'MULTILINESTRING':
+            return f"MULTILINESTRING ({fmt_rings(coords)})"
+
+        elif geom_type == 'MULTIPOINT':
+            points = ', '.join([f"({fmt_point(p)})" for p in coords])
+            return f"MULTIPOINT ({points})"
+
+        return None
+
+    def _scan_features_metadata(self, features: List[Dict]) -> Tuple[int, int, set]:
         """
-        Scan all features to collect unique assay element/unit combinations.
+        Scan features once for image/document counts and assay elements.
 
-        This ensures we create fields for all elements even if the first
-        feature has null assay data.
+        Collecting all assay elements ensures we create fields for every
+        element even if the first feature has null assay data.
 
         Args:
             features: List of feature dictionaries from API
 
         Returns:
-            Set of (element, units) tuples (e.g., {('Au', 'ppm'), ('Cu', 'ppm')})
+            Tuple of (max_images, max_documents, assay_elements) where
+            assay_elements is a set of (element, units) tuples
+            (e.g., {('Au', 'ppm'), ('Cu', 'ppm')})
         """
+        max_images = 0
+        max_docs = 0
         elements = set()
         for feature in features:
+            num_images = len(feature.get('images') or ())
+            if num_images > max_images:
+                max_images = num_images
+            num_docs = len(feature.get('documents') or ())
+            if num_docs > max_docs:
+                max_docs = num_docs
+
             assay_data = feature.get('assay')
-            if isinstance(assay_data, dict) and assay_data.get('merged'):
+            # API payloads are decoded JSON, so an exact type test suffices
+            if type(assay_data) is dict and assay_data.get('merged'):
                 for elem in assay_data.get('elements', []):
                     element_symbol = elem.get('element', '')
-                    units = elem.get('units', 'ppm')
                     if element_symbol:
-                        elements.add((element_symbol, units))
-        return elements
+                        elements.add((element_symbol, elem.get('units', 'ppm')))
+        return max_images, max_docs, elements
 
     def _build_drillsample_geometry(self, feature_data: Dict) -> Optional[str]:
         """
@@ -589,8 +1102,11 @@ class SyncManager:
             Dict with image_1, image_2, document_1, etc. keys
         """
         attrs = {}
+        # Per-URL tracing is debug output; check the level once per feature
+        # so nothing is formatted when it would be discarded.
+        trace = self.logger.isEnabledFor(logging.DEBUG)
 
-        images = feature_data.get('images', [])
+        images = feature_data.get('images') or []
         for i in range(max_images):
             if i < len(images):
                 # Extract full URL from image object
@@ -598,32 +1114,32 @@ class SyncManager:
                 img = images[i]
                 url = img.get('url', '')
 
-                # DEBUG: Log what we're getting from the API
                 if not url:
                     self.logger.warning(f"Empty URL for image {i+1} in feature {feature_data.get('id', 'unknown')}")
-                    self.logger.debug(f"Image object keys: {list(img.keys())}")
-                else:
+                    if trace:
+                        self.logger.debug("Image object keys: %s", list(img.keys()))
+                elif trace:
                     # Log first 100 chars of URL
-                    self.logger.info(f"image_{i+1} URL: {url[:100]}{'...' if len(url) > 100 else ''}")
+                    self.logger.debug("image_%d URL: %.100s%s", i + 1, url, '...' if len(url) > 100 else '')
 
                 attrs[f'image_{i+1}'] = url
             else:
                 attrs[f'image_{i+1}'] = None
 
-        docs = feature_data.get('documents', [])
+        docs = feature_data.get('documents') or []
         for i in range(max_docs):
             if i < len(docs):
                 # FlexibleReferenceField returns 'url', not 'document_url'
                 doc = docs[i]
                 url = doc.get('url', '')
 
-                # DEBUG: Log what we're getting from the API
                 if not url:
                     self.logger.warning(f"Empty URL for document {i+1} in feature {feature_data.get('id', 'unknown')}")
-                    self.logger.debug(f"Document object keys: {list(doc.keys())}")
-                else:
+                    if trace:
+                        self.logger.debug("Document object keys: %s", list(doc.keys()))
+                elif trace:
                     # Log first 100 chars of URL
-                    self.logger.info(f"document_{i+1} URL: {url[:100]}{'...' if len(url) > 100 else ''}")
+                    self.logger.debug("document_%d URL: %.100s%s", i + 1, url, '...' if len(url) > 100 else '')
 
                 attrs[f'document_{i+1}'] = url
             else:
@@ -631,7 +1147,11 @@ class SyncManager:
 
         return attrs
 
-    def _extract_flattened_assay_attributes(self, assay_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_flattened_assay_attributes(
+        self,
+        assay_data: Dict[str, Any],
+        spec: Dict[Tuple[str, str], str]
+    ) -> Dict[str, Any]:
         """
         Extract flattened assay element values from merged assay data.
 
@@ -642,22 +1162,54 @@ class SyncManager:
 
         Args:
             assay_data: Merged assay dictionary from API
+            spec: Column names keyed by (element, units), built once per
+                sync from _scan_features_metadata
 
         Returns:
             Dict with {element}_{units} keys and float values
         """
+        lookup = {
+            (elem.get('element', ''), elem.get('units', 'ppm')): elem.get('value')
+            for elem in assay_data.get('elements', ())
+        }
         attrs = {}
+        for key, column in spec.items():
+            value = lookup.get(key)
+            if value is not None:
+                attrs[column] = float(value)
+        return attrs
 
-        elements = assay_data.get('elements', [])
-        for elem in elements:
-            element_symbol = elem.get('element', '')
-            units = elem.get('units', 'ppm')
-            value = elem.get('value')
-
-            if element_symbol and value is not None:
-                attrs[f'{element_symbol}_{units}'] = float(value)
+    def _configure_model_widgets(
+        self,
+        model_name: str,
+        layer,
+        features: List[Dict[str, Any]],
+        api_client=None,
+        project_id: Optional[int] = None
+    ):
+        """
+        Run the form configurer registered for a model, if any.
 
-        return attrs
+        Args:
+            model_name: Model name (PointSample layers may carry a suffix
+                like PointSample_Soil)
+            layer: QGIS vector layer
+            features: Features pulled for the layer (empty for new layers)
+            api_client: Optional APIClient for lookup table data
+            project_id: Optional project ID for lookup table data
+        """
+        entry = self.WIDGET_CONFIGURERS.get(model_name)
+        if entry is None and model_name.startswith('PointSample_'):
+            entry = self.WIDGET_CONFIGURERS['PointSample']
+        if entry is None:
+            return
+
+        method_name, needs_api = entry
+        configure = getattr(self, method_name)
+        if needs_api:
+            configure(layer, features, api_client=api_client, project_id=project_id)
+        else:
+            configure(layer, features)
 
     def _configure_landholding_widgets(self, layer, features: List[Dict[str, Any]]):
         """
@@ -674,8 +1226,8 @@ class SyncManager:
             layer: The LandHolding layer
             features: List of feature data from API
         """
-        import json
-        from qgis.core import QgsEditorWidgetSetup
+        # Field name -> index, built once instead of repeated indexOf() scans
+        field_index = {field.name(): idx for idx, field in enumerate(layer.fields())}
 
         # Fields to show in the new feature form
         # Note: 'project' is NOT shown - it's auto-set from active project during sync
@@ -691,7 +1243,7 @@ class SyncManager:
         # - geometry: drawn by user on map
 
         # 2. Configure 'land_status' field - dropdown with available options
-        if layer.fields().indexOf('land_status') >= 0:
+        if 'land_status' in field_index:
             # Extract unique land_status options from features
             land_status_options = set()
             for feature in features:
@@ -727,34 +1279,26 @@ class SyncManager:
                 self.logger.info(f"Configured 'land_status' dropdown with {len(value_map)} options")
 
         # 3. Configure 'retain_records' field - read-only, display current status
-        if layer.fields().indexOf('retain_records') >= 0:
+        if 'retain_records' in field_index:
             self.layer_processor.set_field_readonly(layer, 'retain_records', readonly=True)
             self.logger.info("Configured 'retain_records' as read-only")
 
         # 4. Configure 'current_retain_status' - read-only
-        if layer.fields().indexOf('current_retain_status') >= 0:
+        if 'current_retain_status' in field_index:
             self.layer_processor.set_field_readonly(layer, 'current_retain_status', readonly=True)
 
         # 5. Configure image and document fields as clickable URLs
-        # and hide non-visible fields
-        for field in layer.fields():
-            field_name = field.name()
-            if field_name.startswith('image_') or field_name.startswith('document_'):
+        for field_name in field_index:
+            if field_name.startswith(self.EXCLUDE_PREFIXES):
                 # Set as clickable URL instead of plain read-only text
                 self.layer_processor.set_field_as_url(layer, field_name)
-            elif field_name not in visible_fields:
-                # Hide non-essential fields (includes 'project')
-                field_idx = layer.fields().indexOf(field_name)
-                if field_idx >= 0:
-                    layer.setEditorWidgetSetup(
-                        field_idx,
-                        QgsEditorWidgetSetup('Hidden', {})
-                    )
 
-        self.logger.info(
-            f"Configured LandHolding form: showing {len(visible_fields)} fields, "
-            f"hiding {layer.fields().count() - len(visible_fields)} fields"
-        )
+        # Hide non-essential fields (includes 'project'); URL columns stay visible
+        hide_from = {
+            name: idx for name, idx in field_index.items()
+            if not name.startswith(self.EXCLUDE_PREFIXES)
+        }
+        self._hide_non_visible_fields(layer, hide_from, visible_fields, 'LandHolding')
 
     def _configure_drillcollar_widgets(
         self,
@@ -781,7 +1325,8 @@ class SyncManager:
             api_client: Optional APIClient for fetching drill pads
             project_id: Optional project ID for fetching drill pads
         """
-        from qgis.core import QgsEditorWidgetSetup
+        # Field name -> index, built once instead of repeated indexOf() scans
+        field_index = {field.name(): idx for idx, field in enumerate(layer.fields())}
 
         # Fields to show in the new feature form (minimal set for creating new collars)
         # Note: 'project' is NOT shown - it's auto-set from active project during sync
@@ -797,83 +1342,47 @@ class SyncManager:
 
         # 2. Configure 'hole_type' field - dropdown
         # Values from geodb.io API: drill_hole_types in drill_models.py
-        if layer.fields().indexOf('hole_type') >= 0:
-            hole_type_options = [
-                {'Diamond Core': 'DD'},
-                {'Reverse Circulation': 'RC'},
-                {'Direct Circulation': 'DC'},
-                {'Percussion': 'PC'},
-                {'Sonic': 'SN'},
-                {'Trench': 'TR'},
-                {'Other': 'OT'},
-            ]
+        if 'hole_type' in field_index:
             self.layer_processor.configure_field_widget(
                 layer, 'hole_type', 'ValueMap',
-                {'map': hole_type_options}
+                {'map': _HOLE_TYPE_OPTIONS}
             )
             self.logger.info("Configured 'hole_type' dropdown")
 
         # 3. Configure 'hole_status' field - dropdown
         # Values from geodb.io API: drill_hole_status in drill_models.py
-        if layer.fields().indexOf('hole_status') >= 0:
-            hole_status_options = [
-                {'Completed': 'CP'},
-                {'Abandoned': 'AB'},
-                {'Planned': 'PL'},
-                {'In Progress': 'IP'},
-            ]
+        if 'hole_status' in field_index:
             self.layer_processor.configure_field_widget(
                 layer, 'hole_status', 'ValueMap',
-                {'map': hole_status_options}
+                {'map': _HOLE_STATUS_OPTIONS}
             )
             self.logger.info("Configured 'hole_status' dropdown")
 
         # 4. Configure 'hole_size' field - dropdown
         # Values from geodb.io API: drill_hole_size in model_variables.py
-        if layer.fields().indexOf('hole_size') >= 0:
-            hole_size_options = [
-                {'AQ': 'AQ'},
-                {'BQ': 'BQ'},
-                {'NQ': 'NQ'},
-                {'NQ2': 'NQ2'},
-                {'HQ': 'HQ'},
-                {'HQ3': 'HQ3'},
-                {'PQ': 'PQ'},
-                {'Other': 'OT'},
-            ]
+        if 'hole_size' in field_index:
             self.layer_processor.configure_field_widget(
                 layer, 'hole_size', 'ValueMap',
-                {'map': hole_size_options}
+                {'map': _HOLE_SIZE_OPTIONS}
             )
             self.logger.info("Configured 'hole_size' dropdown")
 
         # 5. Configure 'length_units' field - dropdown
-        if layer.fields().indexOf('length_units') >= 0:
-            units_options = [
-                {'Meters': 'M'},
-                {'Feet': 'FT'},
-            ]
+        if 'length_units' in field_index:
             self.layer_processor.configure_field_widget(
                 layer, 'length_units', 'ValueMap',
-                {'map': units_options}
+                {'map': _LENGTH_UNITS_OPTIONS}
             )
             self.logger.info("Configured 'length_units' dropdown")
 
         # 6. Configure 'pad' field - dropdown populated from DrillPads in project
-        if layer.fields().indexOf('pad') >= 0:
+        if 'pad' in field_index:
             pad_options = [{'(No Pad)': ''}]  # Allow unassigned
             # Try to fetch pads from API
             if api_client and project_id:
-                try:
-                    drill_pads = api_client.get_drill_pads(project_id)
-                    for pad in drill_pads:
-                        pad_name = pad.get('name', '')
-                        pad_id = pad.get('id', '')
-                        if pad_name and pad_id:
-                            pad_options.append({pad_name: str(pad_id)})
-                    self.logger.info(f"Fetched {len(drill_pads)} drill pads from API")
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch drill pads from API: {e}")
+                pad_options.extend(self._fetch_lookup_options(
+                    api_client.get_drill_pads, project_id, 'drill pads'
+                ))
             # Fall back to extracting from features if API fetch failed
             if len(pad_options) <= 1:
                 pad_options.extend(self._extract_unique_values(features, 'pad'))
@@ -885,20 +1394,7 @@ class SyncManager:
                 self.logger.info(f"Configured 'pad' dropdown with {len(pad_options)} options")
 
         # 7. Hide all fields that are not in the visible_fields list
-        for field in layer.fields():
-            field_name = field.name()
-            if field_name not in visible_fields:
-                field_idx = layer.fields().indexOf(field_name)
-                if field_idx >= 0:
-                    layer.setEditorWidgetSetup(
-                        field_idx,
-                        QgsEditorWidgetSetup('Hidden', {})
-                    )
-
-        self.logger.info(
-            f"Configured DrillCollar form: showing {len(visible_fields)} fields, "
-            f"hiding {layer.fields().count() - len(visible_fields)} fields"
-        )
+        self._hide_non_visible_fields(layer, field_index, visible_fields, 'DrillCollar')
 
     def _configure_drillpad_widgets(self, layer, features: List[Dict[str, Any]]):
         """
@@ -914,7 +1410,13 @@ class SyncManager:
             layer: The DrillPad layer
             features: List of feature data from API
         """
-        from qgis.core import QgsEditorWidgetSetup
+        # Field name -> index, built once instead of repeated indexOf() scans
+        field_index = {field.name(): idx for idx, field in enumerate(layer.fields())}
+
+        # Nothing here depends on the pulled features, so a layer whose
+        # fields are unchanged since the last sync is already configured
+        if self._form_config_current(layer, tuple(field_index)):
+            return
 
         # Fields to show in the new feature form
         # Note: 'project' is NOT shown - it's auto-set from active project during sync
@@ -925,39 +1427,21 @@ class SyncManager:
         }
 
         # 1. Configure 'status' field - dropdown
-        if layer.fields().indexOf('status') >= 0:
-            status_options = [
-                {'Planned': 'planned'},
-                {'Built': 'built'},
-                {'Historic': 'historic'},
-            ]
+        if 'status' in field_index:
             self.layer_processor.configure_field_widget(
                 layer, 'status', 'ValueMap',
-                {'map': status_options}
+                {'map': _DRILLPAD_STATUS_OPTIONS}
             )
             self.logger.info("Configured 'status' dropdown for DrillPad")
 
         # 2. Configure read-only computed fields
         readonly_fields = ['hole_count', 'total_meters_drilled']
         for field_name in readonly_fields:
-            if layer.fields().indexOf(field_name) >= 0:
+            if field_name in field_index:
                 self.layer_processor.set_field_readonly(layer, field_name, True)
 
         # 3. Hide all fields that are not in the visible_fields list
-        for field in layer.fields():
-            field_name = field.name()
-            if field_name not in visible_fields:
-                field_idx = layer.fields().indexOf(field_name)
-                if field_idx >= 0:
-                    layer.setEditorWidgetSetup(
-                        field_idx,
-                        QgsEditorWidgetSetup('Hidden', {})
-                    )
-
-        self.logger.info(
-            f"Configured DrillPad form: showing {len(visible_fields)} fields, "
-            f"hiding {layer.fields().count() - len(visible_fields)} fields"
-        )
+        self._hide_non_visible_fields(layer, field_index, visible_fields, 'DrillPad')
 
     def _configure_pointsample_widgets(
         self,
@@ -986,7 +1470,8 @@ class SyncManager:
             api_client: Optional APIClient for fetching lithology/alteration types
             project_id: Optional project ID for fetching types from API
         """
-        from qgis.core import QgsEditorWidgetSetup
+        # Field name -> index, built once instead of repeated indexOf() scans
+        field_index = {field.name(): idx for idx, field in enumerate(layer.fields())}
 
         # Fields to show in the new feature form
         # Note: 'id' and 'project' are NOT shown - id is server-assigned,
@@ -1004,24 +1489,15 @@ class SyncManager:
 
         # 3. Configure 'sample_type' field - dropdown with human-readable labels
         # Values from geodb.io API: pointsample_types in model_variables.py
-        if layer.fields().indexOf('sample_type') >= 0:
-            sample_type_options = [
-                {'Soil': 'SL'},
-                {'Rock Chip': 'RK'},
-                {'Outcrop': 'OC'},
-                {'Dump': 'DP'},
-                {'Stream Sediment': 'ST'},
-                {'BLEG': 'BG'},
-                {'Other': 'OT'},
-            ]
+        if 'sample_type' in field_index:
             self.layer_processor.configure_field_widget(
                 layer, 'sample_type', 'ValueMap',
-                {'map': sample_type_options}
+                {'map': _SAMPLE_TYPE_OPTIONS}
             )
             self.logger.info("Configured 'sample_type' dropdown")
 
         # 4. Configure 'ps_type' field - dropdown from company-specific types
-        if layer.fields().indexOf('ps_type') >= 0 and point_sample_types:
+        if 'ps_type' in field_index and point_sample_types:
             ps_type_options = [
                 {pst.name: pst.id} for pst in point_sample_types
             ]
@@ -1033,21 +1509,14 @@ class SyncManager:
                 self.logger.info(f"Configured 'ps_type' dropdown with {len(ps_type_options)} options")
 
         # 5. Configure 'lithology' field - dropdown from API or features
-        if layer.fields().indexOf('lithology') >= 0:
+        if 'lithology' in field_index:
             lithology_options = []
             # Try to fetch from API first (includes all project types)
             self.logger.debug(f"Lithology lookup: api_client={api_client is not None}, project_id={project_id}")
             if api_client and project_id:
-                try:
-                    lithology_types = api_client.get_lithologies(project_id)
-                    lithology_options = [
-                        {lt.get('name', ''): str(lt.get('id', ''))}
-                        for lt in lithology_types
-                        if lt.get('name')
-                    ]
-                    self.logger.info(f"Fetched {len(lithology_options)} lithology types from API")
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch lithology types from API: {e}")
+                lithology_options = self._fetch_lookup_options(
+                    api_client.get_lithologies, project_id, 'lithology types'
+                )
             # Fall back to extracting from features
             if not lithology_options:
                 lithology_options = self._extract_unique_values(features, 'lithology')
@@ -1059,20 +1528,13 @@ class SyncManager:
                 self.logger.info(f"Configured 'lithology' dropdown with {len(lithology_options)} options")
 
         # 6. Configure 'alteration' field - dropdown from API or features
-        if layer.fields().indexOf('alteration') >= 0:
+        if 'alteration' in field_index:
             alteration_options = []
             # Try to fetch from API first (includes all project types)
             if api_client and project_id:
-                try:
-                    alteration_types = api_client.get_alterations(project_id)
-                    alteration_options = [
-                        {at.get('name', ''): str(at.get('id', ''))}
-                        for at in alteration_types
-                        if at.get('name')
-                    ]
-                    self.logger.info(f"Fetched {len(alteration_options)} alteration types from API")
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch alteration types from API: {e}")
+                alteration_options = self._fetch_lookup_options(
+                    api_client.get_alterations, project_id, 'alteration types'
+                )
             # Fall back to extracting from features
             if not alteration_options:
                 alteration_options = self._extract_unique_values(features, 'alteration')
@@ -1084,21 +1546,107 @@ class SyncManager:
                 self.logger.info(f"Configured 'alteration' dropdown with {len(alteration_options)} options")
 
         # 7. Hide all fields that are not in the visible_fields list
-        for field in layer.fields():
-            field_name = field.name()
-            if field_name not in visible_fields:
-                field_idx = layer.fields().indexOf(field_name)
-                if field_idx >= 0:
-                    layer.setEditorWidgetSetup(
-                        field_idx,
-                        QgsEditorWidgetSetup('Hidden', {})
-                    )
+        self._hide_non_visible_fields(layer, field_index, visible_fields, 'PointSample')
+
+    def _form_config_current(self, layer, field_names: Tuple[str, ...]) -> bool:
+        """
+        Check whether a static form setup already ran for this layer layout.
+
+        Only for setups that do not depend on pulled features or API
+        lookups (DrillPad, Photo). Records the layout, so the caller is
+        expected to (re)configure the layer when this returns False.
+
+        Args:
+            layer: The layer being configured
+            field_names: The layer's field names, in order
+
+        Returns:
+            True if the layer was configured with these fields before
+        """
+        layer_id = layer.id()
+        if self._widget_config_cache.get(layer_id) == field_names:
+            return True
+        self._widget_config_cache[layer_id] = field_names
+        return False
+
+    def _hide_non_visible_fields(
+        self,
+        layer,
+        field_index: Dict[str, int],
+        visible_fields: set,
+        form_name: str
+    ):
+        """
+        Hide every field not in visible_fields from the feature form.
+
+        Each setEditorWidgetSetup() rebuilds the layer fields, so fields
+        already hidden by an earlier sync are skipped.
+
+        Args:
+            layer: The layer being configured
+            field_index: Field name -> index for the fields to consider
+            visible_fields: Names of fields that stay in the form
+            form_name: Model name used in the log message
+        """
+        hidden = 0
+        for field_name, field_idx in field_index.items():
+            if field_name in visible_fields:
+                continue
+            hidden += 1
+            if layer.editorWidgetSetup(field_idx).type() != 'Hidden':
+                layer.setEditorWidgetSetup(field_idx, _hidden_widget_setup())
 
         self.logger.info(
-            f"Configured PointSample form: showing {len(visible_fields)} fields, "
-            f"hiding {layer.fields().count() - len(visible_fields)} fields"
+            f"Configured {form_name} form: showing {len(visible_fields)} fields, "
+            f"hiding {hidden} fields"
         )
 
+    def _fetch_lookup_options(
+        self,
+        fetch: Callable[[int], List[Dict[str, Any]]],
+        project_id: int,
+        label: str
+    ) -> List[Dict[str, str]]:
+        """
+        Fetch project lookup records from the API as dropdown options.
+
+        Successful results are cached per (endpoint, project) for
+        LOOKUP_CACHE_TTL seconds, so repeated syncs in one session do not
+        refetch rarely-changing lookup tables (see clear_lookup_cache).
+
+        Args:
+            fetch: APIClient method taking a project ID (e.g. get_lithologies)
+            project_id: Project ID to fetch records for
+            label: Plural description used in log messages
+
+        Returns:
+            List of {name: str(id)} dicts for ValueMap widget
+            (empty if the request fails)
+        """
+        cache_key = (fetch.__name__, project_id)
+        cached = self._lookup_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.LOOKUP_CACHE_TTL:
+            return list(cached[1])
+
+        try:
+            records = fetch(project_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch {label} from API: {e}")
+            return []
+
+        options = [
+            {record['name']: str(record['id'])}
+            for record in records
+            if record.get('name') and record.get('id')
+        ]
+        self.logger.info(f"Fetched {len(options)} {label} from API")
+        self._lookup_cache[cache_key] = (time.monotonic(), options)
+        return list(options)
+
+    def clear_lookup_cache(self):
+        """Drop cached dropdown lookup results so the next sync refetches them."""
+        self._lookup_cache.clear()
+
     def _extract_unique_values(
         self,
         features: List[Dict[str, Any]],
@@ -1119,17 +1667,18 @@ class SyncManager:
         unique_values = {}
         for feature in features:
             value = feature.get(field_name)
-            if value is None:
+            # Skips None, '' and empty dicts in one test
+            if not value:
                 continue
-            if isinstance(value, dict):
+            if isinstance(value, str):
+                if value not in unique_values:
+                    unique_values[value] = value
+            elif isinstance(value, dict):
                 # FK representation: {'id': 1, 'name': 'Granite'}
-                name = value.get('name', '')
-                val_id = value.get('id', '')
+                name = value.get('name')
                 if name and name not in unique_values:
+                    val_id = value.get('id')
                     unique_values[name] = str(val_id) if val_id else name
-            elif isinstance(value, str) and value:
-                if value not in unique_values:
-                    unique_values[value] = value
 
         return [{name: val} for name, val in sorted(unique_values.items())]
 
@@ -1146,9 +1695,12 @@ class SyncManager:
         Args:
             layer: The Photo layer
         """
-        from qgis.core import QgsEditorWidgetSetup, QgsAction
         from ..processors.style_processor import StyleProcessor
 
+        # Static configuration - skip if this layer was already set up
+        if self._form_config_current(layer, tuple(field.name() for field in layer.fields())):
+            return
+
         # 1. Apply camera icon symbology
         style_processor = StyleProcessor()
         style_processor.apply_photo_style(layer)
@@ -1233,19 +1785,9 @@ class SyncManager:
 
         # 8. Configure category dropdown
         if layer.fields().indexOf('category') >= 0:
-            category_options = [
-                {'Drill Core': 'DRL'},
-                {'Map': 'MAP'},
-                {'Field': 'FLD'},
-                {'Aerial': 'AER'},
-                {'Geology': 'GEO'},
-                {'Sample': 'SMP'},
-                {'Equipment': 'EQP'},
-                {'Other': 'OTH'},
-            ]
             self.layer_processor.configure_field_widget(
                 layer, 'category', 'ValueMap',
-                {'map': category_options}
+                {'map': _PHOTO_CATEGORY_OPTIONS}
             )
 
         self.logger.info(
@@ -1266,8 +1808,6 @@ class SyncManager:
         Returns:
             Modified feature dict with normalized geometry
         """
-        import math
-
         # Check if geometry is empty but location exists
         geometry = feature.get('geometry')
         location = feature.get('location')
@@ -1278,7 +1818,6 @@ class SyncManager:
         # Parse location - could be dict or JSON string
         if isinstance(location, str):
             try:
-                import json
                 location = json.loads(location)
             except (json.JSONDecodeError, TypeError):
                 return feature
@@ -1297,28 +1836,21 @@ class SyncManager:
         lon, lat = coords[0], coords[1]
 
         # Create 30m square polygon (same logic as layer_processor._point_to_square_polygon)
-        meters_per_degree_lat = 111320
-        meters_per_degree_lon = 111320 * math.cos(math.radians(lat))
-        size_meters = 30
-
-        half_size_lat = (size_meters / 2) / meters_per_degree_lat
-        half_size_lon = (size_meters / 2) / meters_per_degree_lon
+        half_size_lon = _DRILLPAD_HALF_SIZE_M / (_METERS_PER_DEGREE_LAT * math.cos(math.radians(lat)))
 
         # Use 6 decimal precision for consistency with layer_processor
         min_lon = round(lon - half_size_lon, 6)
         max_lon = round(lon + half_size_lon, 6)
-        min_lat = round(lat - half_size_lat, 6)
-        max_lat = round(lat + half_size_lat, 6)
-
-        # Generate WKT with 6 decimal precision (same as layer_processor)
-        wkt = (
-            f"POLYGON (("
-            f"{min_lon:.6f} {min_lat:.6f}, "
-            f"{max_lon:.6f} {min_lat:.6f}, "
-            f"{max_lon:.6f} {max_lat:.6f}, "
-            f"{min_lon:.6f} {max_lat:.6f}, "
-            f"{min_lon:.6f} {min_lat:.6f}))"
-        )
+        min_lat = round(lat - _DRILLPAD_HALF_SIZE_LAT, 6)
+        max_lat = round(lat + _DRILLPAD_HALF_SIZE_LAT, 6)
+
+        # Generate WKT with 6 decimal precision (same as layer_processor);
+        # each of the four distinct values is formatted once
+        x0 = format(min_lon, '.6f')
+        x1 = format(max_lon, '.6f')
+        y0 = format(min_lat, '.6f')
+        y1 = format(max_lat, '.6f')
+        wkt = f"POLYGON (({x0} {y0}, {x1} {y0}, {x1} {y1}, {x0} {y1}, {x0} {y0}))"
 
         # Return modified feature with generated geometry and cleared location
         normalized = feature.copy()
@@ -1345,6 +1877,7 @@ class SyncManager:
         try:
             self.logger.info(f"Storing snapshot for {model_name} with {len(features)} features")
             snapshot = {}
+            records = {}
             for feature in features:
                 feature_id = feature.get('id')
                 if feature_id:
@@ -1354,12 +1887,14 @@ class SyncManager:
                         if model_name == 'DrillPad':
                             feature = self._normalize_drillpad_geometry(feature)
 
-                        feature_hash = self._compute_feature_hash(feature)
-                        snapshot[feature_id] = feature_hash
+                        hash_data = self._build_hash_data(feature)
+                        records[feature_id] = hash_data
+                        snapshot[feature_id] = self._digest_hash_data(hash_data)
                     except Exception as e:
                         self.logger.error(f"Failed to hash feature {feature_id}: {e}")
 
             self._server_snapshots[model_name] = snapshot
+            self._server_records[model_name] = records
 
             # Also persist to QGIS project for session recovery
             self._save_snapshot_to_project(model_name, snapshot)
@@ -1368,6 +1903,29 @@ class SyncManager:
         except Exception as e:
             self.logger.error(f"Failed to store snapshot for {model_name}: {e}", exc_info=True)
 
+    def _hashed_layer_fields(self, layer) -> List[Tuple[int, str]]:
+        """
+        Get the (index, name) of the layer attributes read for hashing.
+
+        Dynamic image/document columns (read-only display fields) are left
+        out. The skip test runs once per field here instead of once per
+        field per feature.
+
+        Args:
+            layer: QGIS vector layer
+
+        Returns:
+            List of (field index, field name) tuples in layer order
+        """
+        field_names = [field.name() for field in layer.fields()]
+        skip_fields = frozenset(
+            name for name in field_names if name.startswith(self.EXCLUDE_PREFIXES)
+        )
+        return [
+            (idx, name) for idx, name in enumerate(field_names)
+            if name not in skip_fields
+        ]
+
     def _store_snapshot_from_layer(
         self,
         model_name: str,
@@ -1389,54 +1947,72 @@ class SyncManager:
         try:
             self.logger.info(f"Building snapshot from layer for {model_name}")
             snapshot = {}
-
-            # Get all features from layer
-            all_features = self.layer_processor.get_all_features(layer)
+            records = {}
 
             # Get layer CRS for EPSG
             layer_crs = layer.crs()
             epsg_code = layer_crs.postgisSrid() if layer_crs.isValid() else 4326
 
-            for feature in all_features:
-                # Build feature dict the same way get_changed_features does
-                feature_dict = {}
-
-                # Add attributes
-                for field in layer.fields():
-                    field_name = field.name()
+            # (index, name) of the attributes to hash, resolved once per layer
+            kept_fields = self._hashed_layer_fields(layer)
 
-                    # Skip dynamic image/document columns (read-only display fields)
-                    if field_name.startswith('image_') or field_name.startswith('document_'):
-                        continue
+            # Get all features from layer, fetching only the hashed attributes
+            all_features = self.layer_processor.get_all_features(
+                layer, attribute_indices=[idx for idx, _ in kept_fields]
+            )
 
-                    value = feature.attribute(field_name)
-                    feature_dict[field_name] = value
+            feature_dicts = []
+            geometries = []
+            for feature in all_features:
+                # Build feature dict the same way get_changed_features does;
+                # attributes() returns the whole row in one call
+                attrs = feature.attributes()
+                feature_dict = {name: attrs[idx] for idx, name in kept_fields}
+                self._unwrap_qvariants(feature_dict)
 
                 # Add EPSG to feature
                 feature_dict['epsg'] = epsg_code
 
-                # Add geometry in EWKT format (same as get_changed_features)
-                geometry = feature.geometry()
-                if geometry and not geometry.isNull():
-                    ewkt = self.geometry_processor.qgs_to_ewkt(geometry, srid=epsg_code)
-                    feature_dict['geometry'] = ewkt
-
                 # For DrillPad: Normalize to match get_changed_features behavior
                 if model_name == 'DrillPad':
                     feature_dict['location'] = None
                     if 'polygon' not in feature_dict:
                         feature_dict['polygon'] = None
 
-                # Get feature ID and compute hash
-                feature_id = feature_dict.get('id')
-                if feature_id:
+                # Only features with a server ID are part of the snapshot
+                if feature_dict.get('id'):
+                    feature_dicts.append(feature_dict)
+                    geometries.append(feature.geometry())
+
+            # Add geometry in EWKT format (same as get_changed_features),
+            # converted in one batch
+            ewkts = self.geometry_processor.qgs_to_ewkt_batch(geometries, srid=epsg_code)
+            for feature_dict, ewkt in zip(feature_dicts, ewkts):
+                if ewkt is not None:
+                    feature_dict['geometry'] = ewkt
+
+            try:
+                # Normalize and hash every feature in one batch
+                hashes, hash_records = self._hash_features_bulk(feature_dicts)
+                for feature_dict, feature_hash, hash_data in zip(feature_dicts, hashes, hash_records):
+                    feature_id = feature_dict['id']
+                    records[feature_id] = hash_data
+                    snapshot[feature_id] = feature_hash
+            except Exception as e:
+                # Fall back to one feature at a time so a single bad value
+                # only drops that feature from the snapshot
+                self.logger.warning(f"Batch hashing failed for {model_name} ({e}); hashing per feature")
+                for feature_dict in feature_dicts:
+                    feature_id = feature_dict['id']
                     try:
-                        feature_hash = self._compute_feature_hash(feature_dict)
-                        snapshot[feature_id] = feature_hash
+                        hash_data = self._build_hash_data(feature_dict)
+                        records[feature_id] = hash_data
+                        snapshot[feature_id] = self._digest_hash_data(hash_data)
                     except Exception as e:
                         self.logger.error(f"Failed to hash feature {feature_id}: {e}")
 
             self._server_snapshots[model_name] = snapshot
+            self._server_records[model_name] = records
 
             # Also persist to QGIS project for session recovery
             self._save_snapshot_to_project(model_name, snapshot)
@@ -1446,29 +2022,57 @@ class SyncManager:
             self.logger.error(f"Failed to store snapshot from layer for {model_name}: {e}", exc_info=True)
 
     def _save_snapshot_to_project(self, model_name: str, snapshot: Dict[int, str]):
-        """Save snapshot to QGIS project variables."""
+        """
+        Save snapshot to QGIS project variables.
+
+        Re-pulling unchanged data produces the same snapshot; in that case
+        the project entry already holds it, so the write (which also marks
+        the project dirty) is skipped. Only a digest of the last written
+        JSON is kept per model, not a second copy of the snapshot.
+        """
         qgs_project = QgsProject.instance()
-        snapshot_json = json.dumps(snapshot)
-        qgs_project.writeEntry(
-            self.SYNC_VAR_SECTION,
-            f"{model_name}_snapshot",
-            snapshot_json
-        )
+        entry_key = self._snapshot_entry_key(model_name)
+
+        if orjson is not None:
+            snapshot_json = orjson.dumps(snapshot, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        else:
+            snapshot_json = json.dumps(snapshot)
+        digest = hashlib.blake2b(snapshot_json.encode('utf-8'), digest_size=16).digest()
+
+        if self._persisted_snapshots.get(model_name) == digest:
+            # Confirm the current project still holds that JSON (another
+            # project may have been opened since it was written)
+            stored_json = qgs_project.readEntry(self.SYNC_VAR_SECTION, entry_key, "")[0]
+            if stored_json == snapshot_json:
+                return
+
+        qgs_project.writeEntry(self.SYNC_VAR_SECTION, entry_key, snapshot_json)
+        self._persisted_snapshots[model_name] = digest
+
+        # Drop entries in older hash formats (never read again), including
+        # the unversioned one, so they do not linger in the saved project
+        qgs_project.removeEntry(self.SYNC_VAR_SECTION, f"{model_name}_snapshot")
+        for version in range(1, self.SNAPSHOT_FORMAT_VERSION):
+            qgs_project.removeEntry(self.SYNC_VAR_SECTION, f"{model_name}_snapshot_v{version}")
+
+    def _snapshot_entry_key(self, model_name: str) -> str:
+        """Project entry key for a model's snapshot in the current hash format."""
+        return f"{model_name}_snapshot_v{self.SNAPSHOT_FORMAT_VERSION}"
 
     def _load_snapshot_from_project(self, model_name: str) -> Dict[int, str]:
         """Load snapshot from QGIS project variables."""
         qgs_project = QgsProject.instance()
         snapshot_json = qgs_project.readEntry(
             self.SYNC_VAR_SECTION,
-            f"{model_name}_snapshot",
+            self._snapshot_entry_key(model_name),
             ""
         )[0]
 
         if snapshot_json:
             try:
                 # Keys come back as strings, convert to int
-                raw = json.loads(snapshot_json)
-                return {int(k): v for k, v in raw.items()}
+                raw = orjson.loads(snapshot_json) if orjson is not None else json.loads(snapshot_json)
+                return dict(zip(map(int, raw.keys()), raw.values()))
             except (json.JSONDecodeError, ValueError):
                 pass
 
@@ -1488,7 +2092,8 @@ class SyncManager:
         model_name: str,
         feature_id: int,
         current_data: Dict[str, Any],
-        debug: bool = False
+        debug: bool = False,
+        current_hash: Optional[str] = None
     ) -> bool:
         """
         Check if a feature has changed compared to the server snapshot.
@@ -1498,6 +2103,7 @@ class SyncManager:
             feature_id: Feature ID
             current_data: Current feature data
             debug: If True, log detailed diff information
+            current_hash: Precomputed hash of current_data, if available
 
         Returns:
             True if the feature has changed or is new
@@ -1510,8 +2116,12 @@ class SyncManager:
                 self.logger.info(f"Feature {feature_id} is NEW (not in snapshot)")
             return True
 
-        # Compare hashes
-        current_hash = self._compute_feature_hash(current_data)
+        # Compare hashes. There is no cheaper pre-check on last_edited /
+        # updated_at: those columns hold the server's value and are not
+        # touched by edits made in QGIS, so an edited feature still carries
+        # the timestamp stored with its snapshot.
+        if current_hash is None:
+            current_hash = self._compute_feature_hash(current_data)
         original_hash = snapshot[feature_id]
 
         if current_hash != original_hash and debug:
@@ -1529,23 +2139,23 @@ class SyncManager:
         """
         self.logger.info(f"=== Hash diff debug for feature {feature_id} ({model_name}) ===")
 
-        # Build normalized hash data for current feature
+        # Build normalized hash data for current feature. The hashed fields,
+        # already filtered and sorted, are cached per field layout.
+        field_names = tuple(current_data)
+        sorted_keys = self._included_keys_cache.get(field_names)
+        if sorted_keys is None:
+            sorted_keys = self._included_keys_for(field_names)
         hash_data = {}
         raw_types = {}
-        for key, value in current_data.items():
-            if key in self.EXCLUDE_FROM_COMPARISON:
-                continue
-            if key.startswith('image_') or key.startswith('document_'):
-                continue
-            if key.endswith(('_ppm', '_ppb', '_pct', '_opt')):
-                continue
+        for key in sorted_keys:
+            value = current_data[key]
             raw_types[key] = type(value).__name__
             normalized = self._normalize_value_for_hash(value)
             hash_data[key] = normalized
 
         # Log all fields being hashed with their raw types
         self.logger.info("Current data (from QGIS layer):")
-        for key in sorted(hash_data.keys()):
+        for key in sorted_keys:
             value = hash_data[key]
             raw_type = raw_types.get(key, 'unknown')
             if key == 'geometry':
@@ -1612,10 +2222,8 @@ class SyncManager:
             geometry_type = first_feature.get('geometry_type', 'Point')
 
         # Check if geometries have Z dimension (elevation)
-        has_z = self._detect_z_dimension(features)
         # DrillSample always has Z dimension (geometry built from xyz_from/xyz_to coordinates)
-        if model_name.startswith('DrillSample'):
-            has_z = True
+        has_z = model_name.startswith('DrillSample') or self._detect_z_dimension(features)
         if has_z and geometry_type and not geometry_type.endswith('Z'):
             geometry_type = f"{geometry_type}Z"
 
@@ -1625,24 +2233,29 @@ class SyncManager:
         field_definitions = self._extract_field_definitions(first_feature)
 
         # Scan all features for additional assay elements (in case first feature has null assay)
-        all_assay_elements = self._collect_all_assay_elements(features)
-        if all_assay_elements:
+        # and image/document counts in a single pass
+        max_images, max_docs, all_assay_elements = self._scan_features_metadata(features)
+        # Column name for each (element, units) pair, shared by every feature
+        assay_spec = {
+            (element, units): f'{element}_{units}'
+            for element, units in all_assay_elements
+        }
+        if assay_spec:
             # Add any missing assay element fields (e.g., Au_ppm, Cu_ppm)
             existing_field_names = {fd['name'] for fd in field_definitions}
-            for element, units in all_assay_elements:
-                field_name = f'{element}_{units}'
+            for field_name in assay_spec.values():
                 if field_name not in existing_field_names:
                     field_definitions.append({
                         'name': field_name,
                         'type': 'decimal',
                         'length': 0
                     })
-            self.logger.info(f"Assay element fields: {[f'{e}_{u}' for e, u in all_assay_elements]}")
+            self.logger.info(f"Assay element fields: {list(assay_spec.values())}")
 
         # For LandHolding, add dynamic image/document fields
         counts = {'images': 0, 'documents': 0}
         if model_name == 'LandHolding':
-            counts = self._get_max_document_counts(features)
+            counts = {'images': max_images, 'documents': max_docs}
             dynamic_fields = self._create_dynamic_image_document_fields(
                 counts['images'], counts['documents']
             )
@@ -1678,40 +2291,51 @@ class SyncManager:
                 crs_metadata=crs_metadata
             )
 
-        # Since we recreated the layer, no existing features to map
-        id_to_feature = {}
+        # Process features. The layer was just recreated, so every
+        # pulled feature is added (there are no existing features to update).
+        # Attributes are extracted in one batch and completed in the loop below.
+        features_to_add = self.field_processor.extract_attributes_batch(
+            features,
+            field_definitions
+        )
 
-        # Process features
-        added = 0
-        updated = 0
-        features_to_add = []
+        # Model checks are loop-invariant; evaluate them once per pull
+        # (model_name may include a suffix like "_Au_ppm" for assay visualization)
+        is_landholding = model_name == 'LandHolding'
+        is_drillsample = model_name.startswith('DrillSample')
+        # Check both model_name and base_schema_name since FieldTasks uses PointSample schema
+        is_pointsample_data = (
+            model_name.startswith('PointSample') or
+            model_name.startswith('FieldTasks') or
+            base_schema_name == 'PointSample'
+        )
+        img_count = counts['images']
+        doc_count = counts['documents']
 
-        # Collect processed attributes for snapshot (so hash matches what we read back)
-        processed_features_for_snapshot = []
+        # Report progress only when the integer percentage changes
+        total = len(features)
+        progress_step = max(1, total // 100)
+        last_progress = -1
 
         for idx, feature_data in enumerate(features):
-            if progress_callback:
-                progress = int((idx / len(features)) * 100)
-                progress_callback(progress)
-            
-            server_id = feature_data.get('id')
+            if progress_callback and idx % progress_step == 0:
+                progress = (idx * 100) // total
+                if progress != last_progress:
+                    progress_callback(progress)
+                    last_progress = progress
 
-            # Extract attributes
-            attributes = self.field_processor.extract_attributes(
-                feature_data,
-                field_definitions
-            )
+            attributes = features_to_add[idx]
 
             # Flatten merged assay data into {element}_{units} fields (e.g., Au_ppm)
             assay_data = feature_data.get('assay')
-            if isinstance(assay_data, dict) and assay_data.get('merged'):
-                assay_attrs = self._extract_flattened_assay_attributes(assay_data)
+            if type(assay_data) is dict and assay_data.get('merged'):
+                assay_attrs = self._extract_flattened_assay_attributes(assay_data, assay_spec)
                 attributes.update(assay_attrs)
 
             # For LandHolding, extract image/document attributes
-            if model_name == 'LandHolding':
+            if is_landholding:
                 img_doc_attrs = self._extract_image_document_attributes(
-                    feature_data, counts['images'], counts['documents']
+                    feature_data, img_count, doc_count
                 )
                 attributes.update(img_doc_attrs)
 
@@ -1719,9 +2343,6 @@ class SyncManager:
             geom_data = feature_data.get('geometry')
             if geom_data:
                 attributes['geometry'] = geom_data
-                # Log first geometry for debugging
-                if idx == 0:
-                    self.logger.info(f"Geometry format sample: {type(geom_data).__name__}")
 
             # Preserve 'location' field for models like DrillPad that may have
             # a point location even when polygon geometry is null
@@ -1729,120 +2350,35 @@ class SyncManager:
             location_data = feature_data.get('location')
             if location_data:
                 attributes['location'] = location_data
-                if idx == 0 and not geom_data:
-                    self.logger.info(f"Using location field as geometry fallback: {type(location_data).__name__}")
 
-            if not geom_data and not location_data and model_name.startswith('DrillSample'):
+            if not geom_data and not location_data and is_drillsample:
                 # DrillSample has no geometry field - build LineStringZ from xyz_from/xyz_to
-                # Note: model_name may include suffix like "_Au_ppm" for assay visualization
                 line_geom = self._build_drillsample_geometry(feature_data)
                 if line_geom:
                     attributes['geometry'] = line_geom
-                    if idx == 0:
-                        self.logger.info(f"Built LineStringZ geometry from xyz_from/xyz_to")
-                elif idx == 0:
-                    # Log why geometry couldn't be built (first feature only)
-                    has_xyz_from = 'xyz_from_wgs84' in feature_data or 'xyz_from' in feature_data
-                    has_xyz_to = 'xyz_to_wgs84' in feature_data or 'xyz_to' in feature_data
-                    self.logger.warning(
-                        f"DrillSample geometry not built: xyz_from present={has_xyz_from}, "
-                        f"xyz_to present={has_xyz_to}. Available keys: {list(feature_data.keys())[:15]}"
-                    )
 
             # PointSample/FieldTasks: Fall back to target coordinates for planned samples
             # When latitude/longitude are NULL (planned, not yet collected), use target_* coords
-            # Check both model_name and base_schema_name since FieldTasks uses PointSample schema
-            is_pointsample_data = (
-                model_name.startswith('PointSample') or
-                model_name.startswith('FieldTasks') or
-                base_schema_name == 'PointSample'
-            )
             if not geom_data and is_pointsample_data:
                 point_geom = self._build_pointsample_geometry_with_fallback(feature_data)
                 if point_geom:
                     attributes['geometry'] = point_geom
-                    if idx == 0:
-                        # Check if using target coords (planned sample)
-                        has_actual = feature_data.get('latitude') and feature_data.get('longitude')
-                        coord_source = "actual" if has_actual else "target (planned)"
-                        self.logger.info(f"Built PointSample geometry from {coord_source} coordinates")
-            
-            # Collect processed attributes for snapshot computation
-            # This ensures the hash matches what we'll read back from QGIS
-            if server_id:
-                # Build snapshot data matching what get_changed_features will see
-                snapshot_data = dict(attributes)
-                # Ensure id is included (it's needed for lookup)
-                snapshot_data['id'] = server_id
-                # Add epsg field since get_changed_features adds it from layer CRS
-                layer_crs = layer.crs() if layer else None
-                if layer_crs and layer_crs.isValid():
-                    epsg_code = layer_crs.postgisSrid()
-                else:
-                    epsg_code = 4326
-                snapshot_data['epsg'] = epsg_code
-
-                # Convert geometry to EWKT format to match what get_changed_features() returns
-                # get_changed_features() reads from QGIS layer and converts to EWKT
-                # So we need to store the snapshot in the same format for hash comparison
-                geom_value = snapshot_data.get('geometry')
-                if geom_value:
-                    ewkt_geom = self._convert_geometry_to_ewkt(geom_value, epsg_code)
-                    if ewkt_geom:
-                        snapshot_data['geometry'] = ewkt_geom
-
-                # Model-specific normalization to match get_changed_features() behavior
-                # DrillPad: location and polygon are consumed to create geometry
-                if model_name == 'DrillPad':
-                    snapshot_data['location'] = None
-                    if 'polygon' not in snapshot_data:
-                        snapshot_data['polygon'] = None
-
-                processed_features_for_snapshot.append(snapshot_data)
-
-            # Check if feature exists locally
-            if server_id and server_id in id_to_feature:
-                # Update existing feature
-                local_feature = id_to_feature[server_id]
-                self.layer_processor.update_feature(
-                    layer,
-                    local_feature.id(),
-                    attributes
-                )
-                updated += 1
-            else:
-                # Add new feature
-                features_to_add.append(attributes)
-                added += 1
-        
+
+        # Log how the first feature's geometry was sourced (kept out of the loop)
+        self._log_first_geometry_source(
+            features[0], features_to_add[0], is_drillsample, is_pointsample_data
+        )
+                    
         # Batch add new features
         if features_to_add:
             self.layer_processor.add_features(layer, features_to_add)
 
-        # Configure field widgets for LandHolding
-        if model_name == 'LandHolding':
-            self._configure_landholding_widgets(layer, features)
-
-        # Configure field widgets for DrillCollar
-        if model_name == 'DrillCollar':
-            self._configure_drillcollar_widgets(
-                layer, features,
-                api_client=api_client,
-                project_id=project_id
-            )
-
-        # Configure field widgets for DrillPad
-        if model_name == 'DrillPad':
-            self._configure_drillpad_widgets(layer, features)
-
-        # Configure field widgets for PointSample
-        # Note: point_sample_types should be passed from caller if available
-        if model_name == 'PointSample' or model_name.startswith('PointSample_'):
-            self._configure_pointsample_widgets(
-                layer, features,
-                api_client=api_client,
-                project_id=project_id
-            )
+        # Configure field widgets (LandHolding, DrillCollar, DrillPad, PointSample)
+        self._configure_model_widgets(
+            model_name, layer, features,
+            api_client=api_client,
+            project_id=project_id
+        )
 
         # Configure Photo layer with camera icon and image popup
         if model_name == 'Photo':
@@ -1854,8 +2390,8 @@ class SyncManager:
         self._store_snapshot_from_layer(model_name, layer, project_name)
 
         result = {
-            'added': added,
-            'updated': updated,
+            'added': len(features_to_add),
+            'updated': 0,
             'deleted': 0,
             'total': len(features),
             'layer': layer
@@ -1869,12 +2405,53 @@ class SyncManager:
         self.logger.info(f"Sync complete: {result}")
         return result
     
+    def _log_first_geometry_source(
+        self,
+        feature_data: Dict[str, Any],
+        attributes: Dict[str, Any],
+        is_drillsample: bool,
+        is_pointsample_data: bool
+    ):
+        """
+        Log where the first pulled feature's geometry came from.
+
+        Args:
+            feature_data: First feature dictionary from the API
+            attributes: Layer attributes built for that feature
+            is_drillsample: Geometry is built from xyz_from/xyz_to
+            is_pointsample_data: Geometry falls back to target coordinates
+        """
+        geom_data = feature_data.get('geometry')
+        location_data = feature_data.get('location')
+        if geom_data:
+            self.logger.info(f"Geometry format sample: {type(geom_data).__name__}")
+        elif location_data:
+            self.logger.info(f"Using location field as geometry fallback: {type(location_data).__name__}")
+
+        if not geom_data and not location_data and is_drillsample:
+            if attributes.get('geometry'):
+                self.logger.info("Built LineStringZ geometry from xyz_from/xyz_to")
+            else:
+                # Log why geometry couldn't be built (first feature only)
+                has_xyz_from = 'xyz_from_wgs84' in feature_data or 'xyz_from' in feature_data
+                has_xyz_to = 'xyz_to_wgs84' in feature_data or 'xyz_to' in feature_data
+                self.logger.warning(
+                    f"DrillSample geometry not built: xyz_from present={has_xyz_from}, "
+                    f"xyz_to present={has_xyz_to}. Available keys: {list(feature_data.keys())[:15]}"
+                )
+
+        if not geom_data and is_pointsample_data and attributes.get('geometry'):
+            # Check if using target coords (planned sample)
+            has_actual = feature_data.get('latitude') and feature_data.get('longitude')
+            coord_source = "actual" if has_actual else "target (planned)"
+            self.logger.info(f"Built PointSample geometry from {coord_source} coordinates")
+
     def get_changed_features(
         self,
         model_name: str,
         progress_callback: Optional[Callable[[int], None]] = None,
         project_name: Optional[str] = None
-    ) -> Tuple[List[Dict[str, Any]], int, int]:
+    ) -> Tuple[List[Dict[str, Any]], List[Optional[Dict[str, Any]]], int, int]:
         """
         Get features that have been modified locally.
 
@@ -1887,7 +2464,10 @@ class SyncManager:
             project_name: Optional project name for layer lookup
 
         Returns:
-            Tuple of (changed_features, total_checked, skipped_unchanged)
+            Tuple of (changed_features, server_records, total_checked, skipped_unchanged).
+            server_records[i] is the last-known normalized server version of
+            changed_features[i] (see compute_feature_delta), or None for new
+            features and snapshots restored from the project file.
         """
         self.logger.info(f"Getting changed features for: {model_name}")
 
@@ -1895,19 +2475,25 @@ class SyncManager:
         if not layer:
             layer_name = self.layer_processor._build_layer_name(model_name, project_name)
             self.logger.warning(f"Layer not found: {layer_name}")
-            return [], 0, 0
+            return [], [], 0, 0
 
         changed_features = []
+        server_records = []
         skipped_unchanged = 0
 
-        # Get all features
-        all_features = self.layer_processor.get_all_features(layer)
+        # (index, name) of the attributes to read, resolved once per layer
+        kept_fields = self._hashed_layer_fields(layer)
+
+        # Get all features, fetching only the attributes that are read
+        all_features = self.layer_processor.get_all_features(
+            layer, attribute_indices=[idx for idx, _ in kept_fields]
+        )
         total_count = len(all_features)
 
         # Determine snapshot key - use actual layer name for PointSample/DrillSample
         # since they may have suffixes like _Soil_Au_ppb
         snapshot_key = model_name
-        if model_name in ('PointSample', 'DrillSample') and layer:
+        if model_name in _PREFIX_MATCH_MODELS and layer:
             # Extract the model portion from layer name (after project prefix)
             layer_name = layer.name()
             if project_name and layer_name.startswith(f"{project_name}_"):
@@ -1924,62 +2510,86 @@ class SyncManager:
             )
 
         self.logger.info(f"Snapshot has {len(snapshot)} entries for {snapshot_key}")
+        records = self._server_records.get(snapshot_key, {})
 
         # Extract field definitions (needed for type conversion)
         field_definitions = self._get_field_definitions_from_layer(layer)
 
+        # Get layer CRS EPSG code
+        layer_crs = layer.crs()
+        epsg_code = layer_crs.postgisSrid() if layer_crs.isValid() else 4326
+        is_drillpad = model_name == 'DrillPad'
+
+        # Convert all features to API format first so they can be hashed
+        # in one batch
+        feature_dicts = []
+        # Report progress only when the integer percentage changes
+        progress_step = max(1, total_count // 100)
+        last_progress = -1
         for idx, feature in enumerate(all_features):
-            if progress_callback:
-                progress = int((idx / total_count) * 100)
-                progress_callback(progress)
-
-            # Convert feature to API format
-            feature_dict = {}
-
-            # Add attributes
-            for field in layer.fields():
-                field_name = field.name()
-
-                # Skip dynamic image/document columns (read-only display fields)
-                if field_name.startswith('image_') or field_name.startswith('document_'):
-                    continue
-
-                value = feature.attribute(field_name)
-                feature_dict[field_name] = value
-
-            # Get layer CRS EPSG code
-            layer_crs = layer.crs()
-            epsg_code = layer_crs.postgisSrid() if layer_crs.isValid() else 4326
+            if progress_callback and idx % progress_step == 0:
+                progress = (idx * 100) // total_count
+                if progress != last_progress:
+                    progress_callback(progress)
+                    last_progress = progress
+
+            # Convert feature to API format; attributes() returns the whole
+            # row in one call (image/document columns are already left out)
+            attrs = feature.attributes()
+            feature_dict = {name: attrs[field_idx] for field_idx, name in kept_fields}
+            self._unwrap_qvariants(feature_dict)
 
             # Add EPSG to feature
             feature_dict['epsg'] = epsg_code
 
-            # Add geometry in EWKT format (API expects SRID prefix)
-            geometry = feature.geometry()
-            if geometry and not geometry.isNull():
-                ewkt = self.geometry_processor.qgs_to_ewkt(geometry, srid=epsg_code)
-                feature_dict['geometry'] = ewkt
-
             # For DrillPad: Normalize to match snapshot format
             # API has location (point), polygon, and geometry fields
             # When we generate a 30m polygon from location, we need to set:
             # - location = null (consumed to create geometry)
             # - polygon = null (not used for generated polygons)
-            if model_name == 'DrillPad':
+            if is_drillpad:
                 feature_dict['location'] = None
                 # Only set polygon=null if it's not already in the feature
                 if 'polygon' not in feature_dict:
                     feature_dict['polygon'] = None
 
+            feature_dicts.append(feature_dict)
+
+        # Add geometry in EWKT format (API expects SRID prefix), converted
+        # in one batch
+        ewkts = self.geometry_processor.qgs_to_ewkt_batch(
+            [feature.geometry() for feature in all_features], srid=epsg_code
+        )
+        for feature_dict, ewkt in zip(feature_dicts, ewkts):
+            if ewkt is not None:
+                feature_dict['geometry'] = ewkt
+
+        # Only features already in the snapshot are compared by hash
+        hashed_positions = [
+            idx for idx, feature_dict in enumerate(feature_dicts)
+            if feature_dict.get('id') in snapshot
+        ]
+        bulk_hashes = self._compute_feature_hashes_bulk(
+            [feature_dicts[idx] for idx in hashed_positions]
+        )
+        current_hashes = dict(zip(hashed_positions, bulk_hashes))
+
+        for idx, feature_dict in enumerate(feature_dicts):
             # Check if feature has changed
             feature_id = feature_dict.get('id')
             if feature_id:
-                # Enable debug for first feature to diagnose hash mismatches
-                debug_this_feature = (idx == 0 and len(snapshot) > 0)
-                # Use snapshot_key (e.g., PointSample_Soil_Au_ppb) not model_name (PointSample)
-                has_changed = self._feature_has_changed(
-                    snapshot_key, feature_id, feature_dict, debug=debug_this_feature
-                )
+                if idx == 0 and snapshot:
+                    # Enable debug for first feature to diagnose hash mismatches
+                    # Use snapshot_key (e.g., PointSample_Soil_Au_ppb) not model_name (PointSample)
+                    has_changed = self._feature_has_changed(
+                        snapshot_key, feature_id, feature_dict, debug=True,
+                        current_hash=current_hashes.get(idx)
+                    )
+                else:
+                    # Hashes exist only for features in the snapshot; anything
+                    # else is new. Compare inline instead of a call per feature.
+                    current_hash = current_hashes.get(idx)
+                    has_changed = current_hash is None or current_hash != snapshot[feature_id]
 
                 if not has_changed:
                     skipped_unchanged += 1
@@ -1996,12 +2606,13 @@ class SyncManager:
                 prepared['geometry'] = feature_dict['geometry']
 
             changed_features.append(prepared)
+            server_records.append(records.get(feature_id) if feature_id else None)
 
         self.logger.info(
             f"Change detection for {model_name}: "
             f"{len(changed_features)} changed, {skipped_unchanged} unchanged out of {total_count}"
         )
-        return changed_features, total_count, skipped_unchanged
+        return changed_features, server_records, total_count, skipped_unchanged
     
     def sync_push_response(
         self,
@@ -2194,11 +2805,17 @@ class SyncManager:
         conflicts = []
         ids_to_check = set(server_ids)
 
+        id_field_idx = layer.fields().indexFromName('id')
+        if id_field_idx < 0:
+            return []
+
         # Get the snapshot for this model
         snapshot = self._get_snapshot(model_name)
+        kept_fields = None
 
-        for feature in layer.getFeatures():
-            server_id = feature['id']
+        # The local hash is built from attributes only, so skip geometry
+        for feature in layer.getFeatures(self._attribute_request()):
+            server_id = feature.attribute(id_field_idx)
 
             # Normalize server_id to int
             if isinstance(server_id, str):
@@ -2214,12 +2831,11 @@ class SyncManager:
             # Check if this feature has local changes
             if snapshot:
                 # Compute current hash
-                feature_dict = {}
-                for field in layer.fields():
-                    field_name = field.name()
-                    if field_name.startswith('image_') or field_name.startswith('document_'):
-                        continue
-                    feature_dict[field_name] = feature.attribute(field_name)
+                if kept_fields is None:
+                    kept_fields = self._hashed_layer_fields(layer)
+                attrs = feature.attributes()
+                feature_dict = {name: attrs[idx] for idx, name in kept_fields}
+                self._unwrap_qvariants(feature_dict)
 
                 current_hash = self._compute_feature_hash(feature_dict)
                 original_hash = snapshot.get(server_id)
@@ -2280,10 +2896,10 @@ class SyncManager:
             if skip_ids:
                 self.logger.info(f"Skipping {len(skip_ids)} conflicting records from deletion")
 
-        # Find matching features
+        # Find matching features (reading only the id attribute)
         features_to_delete = []
-        for feature in layer.getFeatures():
-            feature_id = feature['id']
+        for feature in layer.getFeatures(self._attribute_request([id_field_idx])):
+            feature_id = feature.attribute(id_field_idx)
             # Handle both int and string representations
             if feature_id in ids_to_remove:
                 features_to_delete.append(feature.id())
@@ -2336,8 +2952,6 @@ class SyncManager:
         Returns:
             True if successfully queued
         """
-        import json
-
         qgs_project = QgsProject.instance()
 
         # Read existing queue
@@ -2389,8 +3003,6 @@ class SyncManager:
         Returns:
             List of queued deletion items
         """
-        import json
-
         qgs_project = QgsProject.instance()
 
         queue_json = qgs_project.readEntry(
@@ -2426,8 +3038,6 @@ class SyncManager:
         Returns:
             True if removed, False if not found
         """
-        import json
-
         qgs_project = QgsProject.instance()
 
         queue_json = qgs_project.readEntry(
@@ -2468,8 +3078,6 @@ class SyncManager:
             model_name: Optional filter to clear only one model's deletions.
                        If None, clears entire queue.
         """
-        import json
-
         qgs_project = QgsProject.instance()
 
         if model_name:
@@ -2663,25 +3271,11 @@ class SyncManager:
             )
 
         # Configure widgets based on model type (same as populated layers)
-        if model_name == 'LandHolding':
-            self._configure_landholding_widgets(layer, [])
-
-        if model_name == 'DrillCollar':
-            self._configure_drillcollar_widgets(
-                layer, [],
-                api_client=api_client,
-                project_id=project_id
-            )
-
-        if model_name == 'DrillPad':
-            self._configure_drillpad_widgets(layer, [])
-
-        if model_name == 'PointSample' or model_name.startswith('PointSample_'):
-            self._configure_pointsample_widgets(
-                layer, [],
-                api_client=api_client,
-                project_id=project_id
-            )
+        self._configure_model_widgets(
+            model_name, layer, [],
+            api_client=api_client,
+            project_id=project_id
+        )
 
         # Store empty snapshot (no features from server)
         self._store_snapshot(model_name, [])
@@ -2723,27 +3317,16 @@ class SyncManager:
             self.logger.warning(f"No schema found for model: {model_name}")
             return []
 
-        field_definitions = []
-
-        # Map schema field types to sync field types
-        type_map = {
-            FieldType.STRING: 'string',
-            FieldType.INTEGER: 'integer',
-            FieldType.DOUBLE: 'decimal',
-            FieldType.BOOLEAN: 'boolean',
-            FieldType.DATE: 'string',  # Store as string for now
-            FieldType.DATETIME: 'string',
-        }
-
-        for field_schema in schema.fields:
-            field_definitions.append({
+        type_map = self.SCHEMA_FIELD_TYPES
+        return [
+            {
                 'name': field_schema.name,
                 'type': type_map.get(field_schema.field_type, 'string'),
                 'length': field_schema.length,
                 'readonly': field_schema.readonly,
-            })
-
-        return field_definitions
+            }
+            for field_schema in schema.fields
+        ]
 
     def _get_geometry_type_from_schema(self, model_name: str) -> str:
         """
@@ -2755,23 +3338,30 @@ class SyncManager:
         Returns:
             Geometry type string (Point, Polygon, etc.)
         """
+        # Static schemas never change at runtime, so the answer is memoized
+        if model_name in self._geometry_type_cache:
+            return self._geometry_type_cache[model_name]
+
         # Extract base model name (e.g., "PointSample_Soil" -> "PointSample")
-        base_model_name = model_name.split('_')[0] if '_' in model_name else model_name
+        base_model_name = model_name.partition('_')[0]
 
         schema = get_schema(base_model_name)
         if not schema:
-            return 'Point'  # Default
-
-        if schema.geometry_type == GeometryType.NONE:
-            return None
+            geometry_type = 'Point'  # Default
+        elif schema.geometry_type == GeometryType.NONE:
+            geometry_type = None
+        else:
+            geometry_type = schema.geometry_type.value
 
-        return schema.geometry_type.value
+        self._geometry_type_cache[model_name] = geometry_type
+        return geometry_type
 
     def _detect_z_dimension(self, features: List[Dict[str, Any]]) -> bool:
         """
         Detect if any feature geometries contain Z (elevation) dimension.
 
-        Checks the first few features for Z coordinates in their geometry strings.
+        Checks the first few features for a Z tag in WKT/EWKT strings or a
+        third ordinate in GeoJSON coordinates.
 
         Args:
             features: List of feature dictionaries from API
@@ -2779,20 +3369,28 @@ class SyncManager:
         Returns:
             True if Z dimension detected
         """
-        # Check first 5 features (or all if fewer)
-        check_count = min(5, len(features))
+        if not features:
+            return False
 
-        for feature in features[:check_count]:
+        # Check first 5 features (or all if fewer)
+        for feature in features[:5]:
             geom_data = feature.get('geometry')
             if not geom_data:
                 continue
 
+            # GeoJSON dict: the first position tells the dimension, no string work
+            if isinstance(geom_data, dict):
+                coords = geom_data.get('coordinates')
+                while isinstance(coords, list) and coords and isinstance(coords[0], list):
+                    coords = coords[0]
+                if isinstance(coords, list) and len(coords) >= 3:
+                    return True
+
             # If geometry is a string (WKT/EWKT format)
-            if isinstance(geom_data, str):
-                geom_upper = geom_data.upper()
-                # Look for "POINT Z", "LINESTRING Z", "POLYGON Z", etc.
-                # or check for 3 coordinate values in WKT
-                if ' Z ' in geom_upper or geom_upper.startswith('SRID=') and ' Z' in geom_upper:
+            elif isinstance(geom_data, str):
+                # Look for "POINT Z (", "LINESTRING Z(", "POLYGON ZM (", "POINT Z EMPTY", etc.
+                # in the type header only (one anchored regex match)
+                if _WKT_Z_RE.match(geom_data):
                     return True
 
         return False
@@ -2811,8 +3409,31 @@ class SyncManager:
         Returns:
             QgsVectorLayer or None
         """
-        from qgis.core import QgsProject
+        cache_key = (model_name, project_name)
+        cached = self._layer_cache.get(cache_key)
+        if cached is not None:
+            layer_id, layer_name = cached
+            layer = self._project.mapLayer(layer_id)
+            # A renamed layer may no longer be the one the name rules pick
+            if layer is not None and layer.name() == layer_name:
+                return layer
+
+        layer = self._resolve_layer(model_name, project_name)
+        if layer is not None:
+            self._layer_cache[cache_key] = (layer.id(), layer.name())
+        return layer
+
+    def _resolve_layer(self, model_name: str, project_name: Optional[str] = None):
+        """
+        Search the project for a model's layer (uncached, see _find_layer).
+
+        Args:
+            model_name: Model name
+            project_name: Optional project name
 
+        Returns:
+            QgsVectorLayer or None
+        """
         # Try exact match with project prefix first
         if project_name:
             layer_name = self.layer_processor._build_layer_name(model_name, project_name)
@@ -2820,54 +3441,58 @@ class SyncManager:
             if layer:
                 return layer
 
-            # For PointSample/DrillSample, try prefix match to find layers
-            # with suffixes like _Soil_Au_ppb
-            if model_name in ('PointSample', 'DrillSample'):
-                prefix = f"{project_name}_{model_name}"
-                for lyr in QgsProject.instance().mapLayers().values():
-                    if hasattr(lyr, 'name') and lyr.name().startswith(prefix):
-                        self.logger.info(f"Found layer by prefix match: {lyr.name()}")
-                        return lyr
+        # For PointSample/DrillSample, try prefix match to find layers
+        # with suffixes like _Soil_Au_ppb. One pass over the project covers
+        # both the project-prefixed and the unprefixed prefix.
+        unprefixed_match = None
+        if model_name in _PREFIX_MATCH_MODELS:
+            prefix = f"{project_name}_{model_name}" if project_name else None
+            for lyr in self._project.mapLayers().values():
+                name = lyr.name()
+                if prefix and name.startswith(prefix):
+                    self.logger.info(f"Found layer by prefix match: {name}")
+                    return lyr
+                if unprefixed_match is None and name.startswith(model_name):
+                    unprefixed_match = lyr
 
         # Fallback to unprefixed name for backwards compatibility
         layer = self.layer_processor.find_layer_by_name(model_name)
         if layer:
             return layer
 
-        # Also try prefix match without project name for PointSample/DrillSample
-        if model_name in ('PointSample', 'DrillSample'):
-            for lyr in QgsProject.instance().mapLayers().values():
-                if hasattr(lyr, 'name') and lyr.name().startswith(model_name):
-                    self.logger.info(f"Found layer by prefix match: {lyr.name()}")
-                    return lyr
+        # Also use the prefix match without project name for PointSample/DrillSample
+        if unprefixed_match is not None:
+            self.logger.info(f"Found layer by prefix match: {unprefixed_match.name()}")
+        return unprefixed_match
 
-        return None
-
-    def _get_field_definitions_from_layer(self, layer) -> List[Dict[str, Any]]:
-        """Get field definitions from existing layer."""
-        field_definitions = []
+    @staticmethod
+    def _attribute_request(attribute_indices: Optional[List[int]] = None) -> QgsFeatureRequest:
+        """
+        Build a feature request that skips geometry.
 
-        for field in layer.fields():
-            field_name = field.name()
+        Args:
+            attribute_indices: Attribute indices to fetch (None for all)
 
-            # Map QGIS type back to API type
-            qgs_type = field.type()
-            if qgs_type == 2:  # Int
-                field_type = 'integer'
-            elif qgs_type == 6:  # Double
-                field_type = 'decimal'
-            elif qgs_type == 1:  # Bool
-                field_type = 'boolean'
-            else:
-                field_type = 'string'
+        Returns:
+            QgsFeatureRequest for attribute-only scans
+        """
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        if attribute_indices is not None:
+            request.setSubsetOfAttributes(attribute_indices)
+        return request
 
-            field_definitions.append({
-                'name': field_name,
-                'type': field_type,
+    def _get_field_definitions_from_layer(self, layer) -> List[Dict[str, Any]]:
+        """Get field definitions from existing layer."""
+        # Map QGIS type back to API type
+        return [
+            {
+                'name': field.name(),
+                'type': _QGS_TYPE_MAP.get(field.type(), 'string'),
                 'length': field.length()
-            })
-
-        return field_definitions
+            }
+            for field in layer.fields()
+        ]
 
     def mark_features_synced(
         self,
@@ -2898,36 +3523,67 @@ class SyncManager:
 
         synced_count = 0
 
-        layer.startEditing()
+        fields = layer.fields()
+        name_field_idx = fields.indexFromName('name')
+        id_field_idx = fields.indexFromName('id')
+
+        # Index local features by name in one pass (first match wins),
+        # reading only the name and id attributes
+        name_index: Dict[Any, Tuple[int, Any]] = {}
+        if name_field_idx >= 0 and id_field_idx >= 0:
+            request = self._attribute_request([name_field_idx, id_field_idx])
+            for local_feature in layer.getFeatures(request):
+                attrs = local_feature.attributes()
+                feature_name = attrs[name_field_idx]
+                # Unnamed (NULL) features cannot be matched by name
+                if feature_name is None or isinstance(feature_name, QVariant):
+                    continue
+                name_index.setdefault(feature_name, (local_feature.id(), attrs[id_field_idx]))
 
+        # Collect the server ID updates as {fid: {id_field_idx: server_id}}
+        changes: Dict[int, Dict[int, Any]] = {}
         for feature_data in features:
             server_id = feature_data.get('_server_id') or feature_data.get('id')
-            local_name = feature_data.get('name')
-
             if not server_id:
                 continue
 
-            # Find feature by name if no local ID mapping
-            for local_feature in layer.getFeatures():
-                feature_name = local_feature.attribute('name')
-                feature_id_attr = local_feature.attribute('id')
-
-                # Match by name if ID not set, or update existing
-                if feature_name == local_name:
-                    # Update the server ID
-                    id_field_idx = layer.fields().indexFromName('id')
-                    if id_field_idx >= 0 and (not feature_id_attr or feature_id_attr != server_id):
-                        layer.changeAttributeValue(local_feature.id(), id_field_idx, server_id)
-                        synced_count += 1
-                    break
-
-        layer.commitChanges()
+            # Match by name if ID not set, or update existing
+            match = name_index.get(feature_data.get('name'))
+            if match is None:
+                continue
+            fid, feature_id_attr = match
+            if not feature_id_attr or feature_id_attr != server_id:
+                # Update the server ID
+                changes[fid] = {id_field_idx: server_id}
+                name_index[feature_data.get('name')] = (fid, server_id)
+                synced_count += 1
+
+        provider = layer.dataProvider()
+        if (not layer.isEditable() and
+                provider.capabilities() & QgsVectorDataProvider.ChangeAttributeValues):
+            # Write every change in one provider call (no edit buffer/undo stack)
+            if changes:
+                provider.changeAttributeValues(changes)
+                # The provider write emits no layer signals, so refresh the
+                # layer explicitly for the attribute table and canvas
+                layer.reload()
+                layer.triggerRepaint()
+        elif changes or layer.isEditable():
+            # An open edit session is committed even without ID changes,
+            # since the pushed values may come from its edit buffer
+            layer.startEditing()
+            for fid, attribute_map in changes.items():
+                for field_idx, value in attribute_map.items():
+                    layer.changeAttributeValue(fid, field_idx, value)
+            layer.commitChanges()
 
         # Update last sync time
         self.set_last_sync_time(model_name, datetime.now().isoformat())
 
         # Update snapshot to reflect current layer state after sync
-        # This ensures subsequent pushes correctly detect changes
+        # This ensures subsequent pushes correctly detect changes.
+        # Needed even when no IDs changed: pushed updates to existing
+        # features must stop counting as local changes.
         self._store_snapshot_from_layer(model_name, layer, project_name)
 
         self.logger.info(f"Marked {synced_count} features as synced")
@@ -2964,14 +3620,25 @@ class SyncManager:
         if not layer:
             return False
 
-        layer.startEditing()
+        feature_count = layer.featureCount()
+        provider = layer.dataProvider()
 
-        # Delete all features
-        feature_ids = [f.id() for f in layer.getFeatures()]
-        layer.deleteFeatures(feature_ids)
+        if (not layer.isEditable() and
+                provider.capabilities() & QgsVectorDataProvider.FastTruncate):
+            # Provider drops every feature in one call
+            provider.truncate()
+            # No layer signals fire for a provider write; refresh the
+            # attribute table and the cached feature count
+            layer.reload()
+        else:
+            layer.startEditing()
+
+            # Delete all features, fetching IDs only (no geometry or attributes)
+            request = self._attribute_request([])
+            layer.deleteFeatures([f.id() for f in layer.getFeatures(request)])
 
-        layer.commitChanges()
+            layer.commitChanges()
         layer.triggerRepaint()
 
-        self.logger.info(f"Cleared {len(feature_ids)} features from {model_name}")
+        self.logger.info(f"Cleared {feature_count} features from {model_name}")
         return True
\ No newline at end of file
@@ -102,23 +102,7 @@ class UserContext:
             last_name=user_data.get('last_name', '')
         )
 
-        # Parse active company
-        active_company = None
-        if data.get('active_company'):
-            ac = data['active_company']
-            active_company = Company(id=ac['id'], name=ac['name'])
-
-        # Parse active project
-        active_project = None
-        if data.get('active_project'):
-            ap = data['active_project']
-            active_project = Project(
-                id=ap['id'],
-                name=ap['name'],
-                company=ap.get('company', ''),
-                crs=ap.get('crs', '4326'),
-                proj4_string=ap.get('proj4_string')
-            )
+        active_company, active_project = cls._parse_active_selection(data)
 
         # Parse accessible companies
         accessible_companies = []
@@ -167,6 +151,60 @@ class UserContext:
             assay_merge_settings=assay_settings
         )
 
+    @classmethod
+    def from_api_response_light(cls, data: Dict[str, Any]) -> 'UserContext':
+        """
+        Create a partial UserContext with only the active selection and permissions.
+
+        Skips the accessible company/project lists, point sample types and
+        assay settings. Use when only user_status, can_create and the active
+        company/project are needed (e.g., after selecting a project).
+
+        Args:
+            data: Response from GET/POST /api/v1/me/
+
+        Returns:
+            UserContext instance with empty accessible lists
+        """
+        user_data = data.get('user', {})
+        user = UserInfo(
+            user_id=0,
+            username=user_data.get('email', ''),
+            email=user_data.get('email', '')
+        )
+        active_company, active_project = cls._parse_active_selection(data)
+
+        return cls(
+            user=user,
+            active_company=active_company,
+            active_project=active_project,
+            user_status=data.get('user_status'),
+            can_create=data.get('can_create', False)
+        )
+
+    @staticmethod
+    def _parse_active_selection(data: Dict[str, Any]):
+        """Parse active company and project from an API response."""
+        # Parse active company
+        active_company = None
+        if data.get('active_company'):
+            ac = data['active_company']
+            active_company = Company(id=ac['id'], name=ac['name'])
+
+        # Parse active project
+        active_project = None
+        if data.get('active_project'):
+            ap = data['active_project']
+            active_project = Project(
+                id=ap['id'],
+                name=ap['name'],
+                company=ap.get('company', ''),
+                crs=ap.get('crs', '4326'),
+                proj4_string=ap.get('proj4_string')
+            )
+
+        return active_company, active_project
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage/serialization."""
         result = {
@@ -189,29 +189,62 @@ class FieldProcessor:
         Returns:
             Dictionary of field name -> converted value
         """
-        import json
-
-        attributes = {}
+        return self.extract_attributes_batch([feature_data], field_definitions)[0]
 
-        for field_def in field_definitions:
-            field_name = field_def.get('name')
-            field_type = field_def.get('type', 'string')
+    def extract_attributes_batch(
+        self,
+        features: List[Dict[str, Any]],
+        field_definitions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract and convert attributes for many API features at once.
 
-            # Get value from feature data
-            value = feature_data.get(field_name)
+        The field definitions are resolved once for the whole batch instead
+        of once per feature.
 
-            # For natural key fields, convert dict to JSON string
-            if field_name in self.NATURAL_KEY_FIELDS and isinstance(value, dict):
-                value = json.dumps(value)
-            # For list fields (like retain_records), convert to JSON string
-            elif isinstance(value, list):
-                value = json.dumps(value)
+        Args:
+            features: Feature data from API
+            field_definitions: Field definitions
 
-            # Convert to QGIS value
-            converted_value = self.api_to_qgs_value(value, field_type)
-            attributes[field_name] = converted_value
+        Returns:
+            List of field name -> converted value dictionaries, in the same
+            order as features
+        """
+        import json
 
-        return attributes
+        # (name, type, is natural key) per field, resolved once
+        field_specs = [
+            (
+                field_def.get('name'),
+                field_def.get('type', 'string'),
+                field_def.get('name') in self.NATURAL_KEY_FIELDS
+            )
+            for field_def in field_definitions
+        ]
+        convert = self.api_to_qgs_value
+
+        results = []
+        for feature_data in features:
+            attributes = {}
+            for field_name, field_type, is_natural_key in field_specs:
+                # Get value from feature data
+                value = feature_data.get(field_name)
+                if value is None:
+                    attributes[field_name] = None
+                    continue
+
+                # For natural key fields, convert dict to JSON string
+                if is_natural_key and isinstance(value, dict):
+                    value = json.dumps(value)
+                # For list fields (like retain_records), convert to JSON string
+                elif isinstance(value, list):
+                    value = json.dumps(value)
+
+                # Convert to QGIS value
+                attributes[field_name] = convert(value, field_type)
+            results.append(attributes)
+
+        return results
     
     # Fields that should be parsed as JSON objects (natural keys and metadata)
     NATURAL_KEY_FIELDS = {
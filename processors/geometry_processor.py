@@ -2,7 +2,7 @@
 """
 Geometry processing for coordinate conversion and WKT handling.
 """
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from qgis.core import QgsGeometry, QgsPointXY, QgsCoordinateReferenceSystem
 
 from ..api.exceptions import GeometryError
@@ -69,6 +69,36 @@ class GeometryProcessor:
             self.logger.error(f"Failed to convert geometry to EWKT: {e}")
             raise GeometryError(f"Failed to convert geometry to EWKT: {e}")
     
+    def qgs_to_ewkt_batch(
+        self,
+        geometries: List[Optional[QgsGeometry]],
+        srid: int = 4326,
+        precision: int = COORDINATE_PRECISION
+    ) -> List[Optional[str]]:
+        """
+        Convert many QGIS geometries to EWKT sharing one SRID prefix.
+
+        Args:
+            geometries: QgsGeometry objects (None or null geometries allowed)
+            srid: Spatial Reference ID (default: 4326 for WGS84)
+            precision: Decimal places for coordinates (default: 6)
+
+        Returns:
+            EWKT strings in the same order, None for null geometries
+        """
+        srid_prefix = f"SRID={srid};"
+        ewkts = []
+        try:
+            for geometry in geometries:
+                if geometry is None or geometry.isNull():
+                    ewkts.append(None)
+                else:
+                    ewkts.append(srid_prefix + geometry.asWkt(precision))
+        except Exception as e:
+            self.logger.error(f"Failed to convert geometry to EWKT: {e}")
+            raise GeometryError(f"Failed to convert geometry to EWKT: {e}")
+        return ewkts
+
     def wkt_to_qgs(self, wkt: str) -> Optional[QgsGeometry]:
         """
         Convert WKT to QGIS geometry.
@@ -10,6 +10,7 @@ from qgis.core import (
     QgsVectorLayer,
     QgsVectorFileWriter,
     QgsFeature,
+    QgsFeatureRequest,
     QgsGeometry,
     QgsFields,
     QgsWkbTypes,
@@ -896,17 +897,27 @@ class LayerProcessor:
 
         return result
 
-    def get_all_features(self, layer: QgsVectorLayer) -> List[QgsFeature]:
+    def get_all_features(
+        self,
+        layer: QgsVectorLayer,
+        attribute_indices: Optional[List[int]] = None
+    ) -> List[QgsFeature]:
         """
         Get all features from layer.
 
         Args:
             layer: Source layer
+            attribute_indices: Optional field indices to fetch; other
+                attributes are left NULL (feature.attributes() keeps its
+                full length, so indices stay valid)
 
         Returns:
             List of QgsFeature objects
         """
-        return list(layer.getFeatures())
+        if attribute_indices is None:
+            return list(layer.getFeatures())
+        request = QgsFeatureRequest().setSubsetOfAttributes(attribute_indices)
+        return list(layer.getFeatures(request))
 
     def layer_exists(self, model_name: str) -> bool:
         """
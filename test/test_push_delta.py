@@ -0,0 +1,100 @@
+# coding=utf-8
+"""Diff-only push tests.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'admin@geodb.io'
+__date__ = '2026-10-18'
+__copyright__ = 'Copyright 2026, geodb.io'
+
+import unittest
+from unittest.mock import MagicMock
+
+from .utilities import get_qgis_app
+from ..managers.data_manager import DataManager
+from ..managers.sync_manager import SyncManager
+
+QGIS_APP = get_qgis_app()
+
+
+class PushDeltaTest(unittest.TestCase):
+    """Test the PATCH payload built from a feature and its server record."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.sync_manager = SyncManager(MagicMock())
+        self.data_manager = DataManager(
+            MagicMock(), MagicMock(), MagicMock(), self.sync_manager
+        )
+
+    def server_record_for(self, feature):
+        """Normalized server record matching the given feature."""
+        return self.sync_manager._build_hash_data(dict(feature))
+
+    def patch_payload(self, model_name, feature, server_feature):
+        """Delta of feature against server_feature, prepared for PATCH."""
+        delta = self.sync_manager.compute_feature_delta(
+            feature, self.server_record_for(server_feature)
+        )
+        return self.data_manager._prepare_patch_payload(model_name, delta)
+
+    def test_unchanged_feature(self):
+        """An unchanged feature produces an empty delta."""
+        feature = {
+            'id': 7,
+            'name': 'PS-001',
+            'sample_type': 'Rock',
+            'geometry': 'SRID=4326;Point Z (-116.2 48.5 1453.6)',
+        }
+        delta = self.sync_manager.compute_feature_delta(
+            feature, self.server_record_for(feature)
+        )
+        self.assertEqual(delta, {})
+        self.assertEqual(self.data_manager._prepare_patch_payload('PointSample', delta), {})
+
+    def test_geometry_only_change(self):
+        """A moved point sends only its coordinates."""
+        server_feature = {
+            'id': 7,
+            'name': 'PS-001',
+            'sample_type': 'Rock',
+            'geometry': 'SRID=4326;Point Z (-116.2 48.5 1453.6)',
+        }
+        feature = dict(server_feature, geometry='SRID=4326;Point Z (-116.3 48.6 1460)')
+        payload = self.patch_payload('PointSample', feature, server_feature)
+        self.assertNotIn('geometry', payload)
+        self.assertNotIn('name', payload)
+        self.assertNotIn('sample_type', payload)
+        self.assertAlmostEqual(payload['longitude'], -116.3)
+        self.assertAlmostEqual(payload['latitude'], 48.6)
+        self.assertAlmostEqual(payload['elevation'], 1460)
+
+    def test_cleared_required_field(self):
+        """A cleared required field is sent with its default, not as null."""
+        server_feature = {'id': 3, 'name': 'Claim 1', 'dropped': True, 'notes': 'x'}
+        feature = dict(server_feature, dropped=None)
+        payload = self.patch_payload('LandHolding', feature, server_feature)
+        self.assertEqual(payload, {'dropped': False})
+
+        server_feature = {'id': 4, 'name': 'Pad 1', 'status': 'drilled', 'notes': 'x'}
+        feature = dict(server_feature, status=None)
+        payload = self.patch_payload('DrillPad', feature, server_feature)
+        self.assertEqual(payload, {'status': 'planned'})
+
+    def test_missing_required_field_not_added(self):
+        """Required defaults are not added to a delta that lacks the field."""
+        server_feature = {'id': 3, 'name': 'Claim 1', 'dropped': True, 'notes': 'x'}
+        feature = dict(server_feature, notes='y')
+        payload = self.patch_payload('LandHolding', feature, server_feature)
+        self.assertEqual(payload, {'notes': 'y'})
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(PushDeltaTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
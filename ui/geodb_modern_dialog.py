@@ -445,6 +445,7 @@ class GeodbModernDialog(QDialog, FORM_CLASS):
 
             # Clear claims manager cache (tokens are now invalid)
             self.claims_manager.clear_cache()
+            self.sync_manager.clear_lookup_cache()
 
             # Update UI
             self._update_auth_status(False)
@@ -478,6 +479,7 @@ class GeodbModernDialog(QDialog, FORM_CLASS):
             self.data_manager.api_client = self.api_client
             self.claims_manager.api = self.api_client
             self.claims_manager.clear_cache()
+            self.sync_manager.clear_lookup_cache()
 
             # Log the change
             mode = "LOCAL DEVELOPMENT" if is_enabled else "PRODUCTION"
@@ -614,6 +616,9 @@ class GeodbModernDialog(QDialog, FORM_CLASS):
         self._log_message("Refreshing company and project lists...", "info")
         self.refreshProjectsButton.setEnabled(False)
 
+        # Explicit refresh - refetch dropdown lookups on the next sync too
+        self.sync_manager.clear_lookup_cache()
+
         # Get the base URL and token for the worker thread
         base_url = self.config.base_url
         token = self.api_client.token
@@ -1493,6 +1498,7 @@ class GeodbModernDialog(QDialog, FORM_CLASS):
                 updated = result.get('updated', 0)
                 errors = result.get('errors', 0)
                 skipped = result.get('skipped', 0)
+                not_writable = result.get('not_writable', 0)
 
                 message_parts = []
                 if created > 0:
@@ -1503,6 +1509,8 @@ class GeodbModernDialog(QDialog, FORM_CLASS):
                     message_parts.append(f"{errors} errors")
                 if skipped > 0:
                     message_parts.append(f"{skipped} unchanged (skipped)")
+                if not_writable > 0:
+                    message_parts.append(f"{not_writable} with only read-only changes")
 
                 if message_parts:
                     message = f"✓ Push complete: {', '.join(message_parts)}"